@@ -0,0 +1,25 @@
+"""HTTP response helpers shared by the API and OAuth clients."""
+
+from __future__ import annotations
+
+import aiohttp
+
+from .const import MAX_ERROR_RESPONSE_LENGTH
+
+
+async def read_error_text(response: aiohttp.ClientResponse) -> str:
+    """Read a bounded prefix of an error response body for diagnostics.
+
+    Only the first ``MAX_ERROR_RESPONSE_LENGTH`` bytes are read, so a large
+    HTML error page is never buffered in full just to build an exception
+    message.
+
+    Args:
+        response: The unsuccessful HTTP response
+
+    Returns:
+        The decoded (and possibly truncated) body text
+
+    """
+    body = await response.content.read(MAX_ERROR_RESPONSE_LENGTH)
+    return body.decode("utf-8", "replace")
@@ -0,0 +1,47 @@
+"""JSON encoding helpers with an optional fast backend.
+
+When :mod:`orjson` is installed (``pip install actron-neo-api[speedups]``)
+it is used for encoding and decoding; otherwise the standard library
+:mod:`json` module is used. Both backends produce compact output.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    HAS_ORJSON = False
+else:  # pragma: no cover - depends on the installed extras
+    HAS_ORJSON = True
+
+
+if HAS_ORJSON:  # pragma: no cover - depends on the installed extras
+
+    def loads(data: str | bytes) -> Any:
+        """Decode a JSON document using orjson."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode an object as a compact JSON string using orjson."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes using orjson."""
+        return orjson.dumps(obj)
+
+else:
+
+    def loads(data: str | bytes) -> Any:
+        """Decode a JSON document using the standard library."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode an object as a compact JSON string using the standard library."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes using the standard library."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -3,25 +3,62 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+import random
+import sys
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from copy import deepcopy
-from typing import Any, Literal
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Final, Literal
 
 import aiohttp
+from pydantic import TypeAdapter
+from yarl import URL
 
+from . import _json
+from ._http import read_error_text
 from .const import (
+    API_PATH_AC_SYSTEMS,
+    API_PATH_REALTIME_APP,
+    API_PATH_REALTIME_DETAILS,
     BASE_URL_DEFAULT,
     BASE_URL_NIMBUS,
     BASE_URL_QUE,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
     COMMAND_DEBOUNCE_SECONDS,
     HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_IDEMPOTENT_METHODS,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_RETRY_ATTEMPTS,
+    HTTP_RETRY_BASE_DELAY,
+    HTTP_RETRY_MAX_DELAY,
+    HTTP_RETRY_STATUSES,
+    HTTP_RETRY_STATUSES_NON_IDEMPOTENT,
+    HTTP_SOCK_READ_TIMEOUT,
     HTTP_TOTAL_TIMEOUT,
-    MAX_ERROR_RESPONSE_LENGTH,
+    NX_GEN_SYSTEM_TYPES,
     OAUTH_CLIENT_ID,
     PLATFORM_NEO,
     PLATFORM_QUE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_INITIAL_RATE,
+    RATE_LIMIT_MAX_PAUSE,
+    RATE_LIMIT_MAX_RATE,
+    RATE_LIMIT_MIN_RATE,
+    RATE_LIMIT_QUOTA_THRESHOLD,
+    STATUS_CACHE_TTL,
+    SYSTEMS_CACHE_TTL,
 )
 from .exceptions import ActronAirAPIError, ActronAirAuthError
 from .models import (
@@ -43,6 +80,190 @@ from .state import StateManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validates a whole ac-system list in one call to the pydantic-core validator
+_SYSTEMS_ADAPTER: Final[TypeAdapter[list[ActronAirSystemInfo]]] = TypeAdapter(
+    list[ActronAirSystemInfo]
+)
+
+# Static headers for JSON request bodies; copied, never mutated, per request
+_JSON_HEADERS: Final[dict[str, str]] = {"Content-Type": "application/json"}
+
+# Single-flight key: endpoint, params, headers and the identity of the
+# validators dict a conditional request reads and updates
+_InflightKey = tuple[str, tuple[tuple[str, Any], ...], tuple[tuple[str, str], ...], int | None]
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_serial(serial_number: str) -> str:
+    """Return the interned, lowercased form of a serial number.
+
+    Serial numbers come from a small fixed set, so the lowercased string is
+    computed once per distinct input and shared by every later lookup.
+    """
+    return sys.intern(serial_number.lower())
+
+
+class _NotModifiedError(Exception):
+    """Raised internally when a conditional GET is answered with 304."""
+
+
+class _CircuitBreaker:
+    """Fast-fail requests while the upstream API is persistently unavailable.
+
+    The breaker opens after ``failure_threshold`` consecutive failures. While
+    open, requests are rejected immediately. Once ``reset_timeout`` has
+    elapsed a single probe request is let through (half-open); its outcome
+    either closes the breaker or re-opens it for another timeout window.
+    """
+
+    __slots__ = ("failure_threshold", "reset_timeout", "_failures", "_opened_at")
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialise a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the breaker opens
+            reset_timeout: Seconds to stay open before allowing a probe
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """Return the current breaker state."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before(self) -> None:
+        """Check whether a request may proceed.
+
+        Raises:
+            ActronAirAPIError: If the breaker is open
+
+        """
+        state = self.state
+        if state == "open":
+            raise ActronAirAPIError("Circuit open: Actron Air API is unavailable")
+        if state == "half_open":
+            # Re-arm the timer so only this caller probes; others keep fast-failing
+            self._opened_at = time.monotonic()
+
+    def on_success(self) -> None:
+        """Record a request that reached a responsive server."""
+        self._failures = 0
+        self._opened_at = None
+
+    def on_failure(self) -> None:
+        """Record a connection failure or server error."""
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Opening circuit breaker after %d consecutive failures", self._failures
+                )
+            self._opened_at = time.monotonic()
+
+
+class _RateLimiter:
+    """Adaptive token bucket pacing requests to the Actron Air API.
+
+    Tokens refill at ``rate`` per second up to ``burst``. The rate grows
+    additively after each successful response and is cut multiplicatively
+    when the server signals overload, so sustained throughput tracks what
+    the upstream accepts (AIMD). Callers reserve a token synchronously and
+    sleep only for their own slot, so no lock is needed.
+
+    When the server reports its own quota (``X-RateLimit-*`` headers) or asks
+    for a pause (``Retry-After``), every caller waits until it has passed.
+    """
+
+    __slots__ = ("rate", "min_rate", "max_rate", "burst", "_tokens", "_updated", "_paused_until")
+
+    def __init__(self, rate: float, min_rate: float, max_rate: float, burst: float) -> None:
+        """Initialise a full bucket.
+
+        Args:
+            rate: Initial refill rate in requests per second
+            min_rate: Lower bound for the refill rate
+            max_rate: Upper bound for the refill rate
+            burst: Bucket capacity in requests
+
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            await asyncio.sleep(self._paused_until - now)
+            now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def on_success(self) -> None:
+        """Raise the rate after a successful response."""
+        self.rate = min(self.max_rate, self.rate + RATE_LIMIT_INCREASE)
+
+    def on_throttle(self) -> None:
+        """Cut the rate, and any saved-up burst, after an overload response."""
+        self.rate = max(self.min_rate, self.rate * RATE_LIMIT_DECREASE)
+        self._tokens = min(self._tokens, self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for the given time, capped at the maximum pause."""
+        until = time.monotonic() + min(seconds, RATE_LIMIT_MAX_PAUSE)
+        self._paused_until = max(self._paused_until, until)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Pause ahead of time when the reported request quota is nearly spent.
+
+        Args:
+            headers: Response headers, checked for ``X-RateLimit-Remaining``,
+                ``X-RateLimit-Limit`` and ``X-RateLimit-Reset``
+
+        """
+        remaining = self._header_number(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        limit = self._header_number(headers, "X-RateLimit-Limit")
+        threshold = limit * RATE_LIMIT_QUOTA_THRESHOLD if limit else 1.0
+        if remaining >= threshold:
+            return
+        reset = self._header_number(headers, "X-RateLimit-Reset")
+        if reset is None:
+            return
+        if reset > 1e9:
+            # An epoch timestamp rather than a number of seconds
+            reset -= time.time()
+        if reset > 0:
+            self.pause(reset)
+
+    @staticmethod
+    def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+        """Return a numeric header value, or None if absent or malformed."""
+        value = headers.get(name)
+        if not isinstance(value, str):
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
 
 class _PendingBatch:
     """A batch of set-settings commands being coalesced for a single system."""
@@ -253,6 +474,11 @@ class ActronAirAPI:
 
     This client provides a modern, structured approach to interacting with
     the Actron Air API while maintaining compatibility with the previous interface.
+
+    Long-lived applications that create several clients (for example a
+    configuration check followed by a runtime client) should pass a shared
+    ``aiohttp.ClientSession`` so every instance reuses one connection pool.
+    An injected session is never closed by :meth:`close`.
     """
 
     def __init__(
@@ -262,6 +488,8 @@ class ActronAirAPI:
         platform: Literal["neo", "que"] | None = None,
         session: aiohttp.ClientSession | None = None,
         debounce_seconds: float = COMMAND_DEBOUNCE_SECONDS,
+        timeout: aiohttp.ClientTimeout | None = None,
+        connector: aiohttp.BaseConnector | None = None,
     ):
         """Initialize the ActronAirAPI client with OAuth2 authentication.
 
@@ -275,6 +503,11 @@ class ActronAirAPI:
                 will NOT be closed by :meth:`close`.
             debounce_seconds: Debounce window for coalescing ``set-settings``
                 commands (default: 0.1 s).  Set to 0 to disable coalescing.
+            timeout: Optional timeout for the client-owned session. Ignored when
+                ``session`` is provided.
+            connector: Optional connector for the client-owned session. The
+                caller retains ownership; it is not closed by :meth:`close`.
+                Ignored when ``session`` is provided.
 
         """
         # Determine base URL from platform parameter
@@ -310,13 +543,39 @@ class ActronAirAPI:
 
         # Internal cache of system info models for link resolution
         self.systems: list[ActronAirSystemInfo] = []
+        self._systems_cache: tuple[float, list[ActronAirSystemInfo]] | None = None
+        self._systems_cache_ttl: float = SYSTEMS_CACHE_TTL
+        # Raw status payloads keyed by lowercased serial, with their fetch time
+        self._status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._status_cache_ttl: float = STATUS_CACHE_TTL
+        # ETag / Last-Modified of each cached payload, for conditional refetches
+        self._status_validators: dict[str, dict[str, str]] = {}
+        # Bumped on every invalidation so a fetch that was already in flight
+        # when a system changed does not cache its possibly stale payload
+        self._status_generation: dict[str, int] = {}
         self._initialized = False
 
         # Session management
         self._session: aiohttp.ClientSession | None = session
         self._external_session = session is not None
+        self._timeout = timeout
+        self._connector = connector
+        # A connector does not close a resolver it was given, so we do
+        self._resolver: aiohttp.abc.AbstractResolver | None = None
         self._session_lock = asyncio.Lock()
         self._init_lock = asyncio.Lock()
+        self._breaker = _CircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT
+        )
+        self._limiter = _RateLimiter(
+            RATE_LIMIT_INITIAL_RATE, RATE_LIMIT_MIN_RATE, RATE_LIMIT_MAX_RATE, RATE_LIMIT_BURST
+        )
+
+        # Commands to the same system are posted one at a time, in order. A
+        # lock is only kept while a command holds or awaits it
+        self._command_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
 
         # Command coalescing
         self._coalescer = CommandCoalescer(
@@ -338,6 +597,21 @@ class ActronAirAPI:
         self._refresh_tasks_lock = asyncio.Lock()
         self._refresh_status_tasks: dict[str, asyncio.Task[ActronAirStatus | None]] = {}
 
+        # Single-flight table for concurrent identical GET requests
+        self._inflight_gets: dict[_InflightKey, asyncio.Task[dict[str, Any]]] = {}
+
+    @property
+    def base_url(self) -> str:
+        """Get the base URL for the current platform."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """Set the base URL and precompute the request URL prefix."""
+        self._base_url = value
+        self._url_prefix = f"{value.rstrip('/')}/"
+        self._url_cache: dict[str, URL] = {}
+
     @property
     def platform(self) -> str:
         """Get the current platform being used.
@@ -358,9 +632,63 @@ class ActronAirAPI:
         """
         return self.oauth2_auth.authenticated_platform
 
+    @property
+    def systems(self) -> list[ActronAirSystemInfo]:
+        """Get the cached system info models used for link resolution."""
+        return self._systems
+
+    @systems.setter
+    def systems(self, systems: list[ActronAirSystemInfo]) -> None:
+        """Replace the cached systems and rebuild the HAL link index."""
+        self._systems = systems
+        index: dict[tuple[str, str], str] = {}
+        for system in systems:
+            serial_lower = _normalize_serial(system.serial)
+            if not isinstance(system.links, dict):
+                continue
+            for rel in system.links:
+                href = self._resolve_link_href(system, rel)
+                if href:
+                    index.setdefault((serial_lower, rel), href)
+        self._link_index = index
+
+    @staticmethod
+    def _resolve_link_href(system: ActronAirSystemInfo, rel: str) -> str | None:
+        """Extract a HAL link href for a system, with the leading slash removed.
+
+        Args:
+            system: System info model carrying HAL links
+            rel: The relationship name of the link to retrieve
+
+        Returns:
+            The href URL string with leading slash removed, or None if not found
+
+        """
+        links = system.links
+        if not links or not isinstance(links, dict):
+            return None
+
+        link_info = links.get(rel)
+        href: str | None = None
+
+        if isinstance(link_info, dict):
+            href_value = link_info.get("href")
+            href = href_value if isinstance(href_value, str) else None
+        elif isinstance(link_info, list) and link_info:
+            first_item = link_info[0]
+            if isinstance(first_item, dict):
+                href_value = first_item.get("href")
+                href = href_value if isinstance(href_value, str) else None
+
+        return href.lstrip("/") if href else None
+
     def _get_system_link(self, serial_number: str, rel: str) -> str | None:
         """Return a HAL link for a cached system if available.
 
+        Links are looked up in an index built when :attr:`systems` is
+        assigned. On a miss the systems are scanned directly, so links on
+        systems that were mutated in place are still found.
+
         Args:
             serial_number: Serial number of the AC system
             rel: The relationship name of the link to retrieve
@@ -370,30 +698,17 @@ class ActronAirAPI:
 
         """
         # Normalize serial number comparison (case-insensitive)
-        serial_lower = serial_number.lower()
-
-        for system in self.systems:
-            if system.serial.lower() != serial_lower:
-                continue
+        serial_lower = _normalize_serial(serial_number)
 
-            links = system.links
-            if not links:
-                continue
+        href = self._link_index.get((serial_lower, rel))
+        if href is not None:
+            return href
 
-            link_info = links.get(rel)
-            href: str | None = None
-
-            if isinstance(link_info, dict):
-                href_value = link_info.get("href")
-                href = href_value if isinstance(href_value, str) else None
-            elif isinstance(link_info, list) and link_info:
-                first_item = link_info[0]
-                if isinstance(first_item, dict):
-                    href_value = first_item.get("href")
-                    href = href_value if isinstance(href_value, str) else None
-
-            if href:
-                return href.lstrip("/")
+        for system in self._systems:
+            if system.serial.lower() == serial_lower:
+                href = self._resolve_link_href(system, rel)
+                if href:
+                    return href
 
         return None
 
@@ -410,8 +725,7 @@ class ActronAirAPI:
         """
         if not system.type:
             return False
-        system_type = str(system.type).replace("-", "").lower()
-        return system_type == "nxgen"
+        return system.type.replace("-", "").lower() in NX_GEN_SYSTEM_TYPES
 
     def _set_base_url(self, base_url: str, platform: str) -> None:
         """Update the base URL and platform, preserving existing authentication tokens.
@@ -446,8 +760,9 @@ class ActronAirAPI:
             systems: List of AC systems to analyze
 
         Note:
-            Platform priority: Actron Connect > QUE (NX Gen) > NIMBUS (Neo).
-            Switches to the highest priority platform found in the systems list.
+            Platform priority: QUE (NX Gen) > NIMBUS (Neo). Switches to the
+            highest priority platform found in the systems list, stopping at
+            the first NX Gen system.
 
         """
         if not self._auto_manage_base_url or not systems:
@@ -486,18 +801,66 @@ class ActronAirAPI:
             self._initialized = True
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp ClientSession."""
+        """Get or create an aiohttp ClientSession.
+
+        Sessions created here use a pooled connector with keep-alive and DNS
+        caching so repeated requests to the same host reuse TCP/TLS connections,
+        unless a timeout or connector was supplied to the constructor.
+        """
+        # Fast path: no lock needed once a live session exists
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+
         async with self._session_lock:
             if self._session is None or self._session.closed:
-                timeout = aiohttp.ClientTimeout(
-                    total=HTTP_TOTAL_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT
+                timeout = self._timeout or aiohttp.ClientTimeout(
+                    total=HTTP_TOTAL_TIMEOUT,
+                    connect=HTTP_CONNECT_TIMEOUT,
+                    sock_read=HTTP_SOCK_READ_TIMEOUT,
+                )
+                connector = self._connector
+                if connector is None:
+                    await self._close_resolver()
+                    self._resolver = self._create_resolver()
+                    connector = aiohttp.TCPConnector(
+                        resolver=self._resolver,
+                        limit=HTTP_CONNECTION_LIMIT,
+                        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    )
+                self._session = aiohttp.ClientSession(
+                    timeout=timeout,
+                    connector=connector,
+                    json_serialize=_json.dumps,
+                    connector_owner=self._connector is None,
                 )
-                self._session = aiohttp.ClientSession(timeout=timeout)
                 self._external_session = False
                 self.oauth2_auth.set_session(self._session)
                 return self._session
             return self._session
 
+    @staticmethod
+    def _create_resolver() -> aiohttp.abc.AbstractResolver | None:
+        """Create an aiodns-backed resolver if aiodns is installed.
+
+        Returns:
+            An :class:`aiohttp.AsyncResolver`, or None to use aiohttp's default
+            thread-pool resolver when the optional ``aiodns`` package is absent.
+
+        """
+        try:
+            return aiohttp.AsyncResolver()
+        except RuntimeError:
+            return None
+
+    async def _close_resolver(self) -> None:
+        """Close the resolver created for our own connector, if any."""
+        resolver, self._resolver = self._resolver, None
+        if resolver is not None:
+            await resolver.close()
+
     async def close(self) -> None:
         """Close the API client and release resources.
 
@@ -512,6 +875,8 @@ class ActronAirAPI:
             if self._session and not self._session.closed and not self._external_session:
                 await self._session.close()
                 self._session = None
+            await self._close_resolver()
+        await self.oauth2_auth.close()
 
     async def start_push(
         self,
@@ -697,7 +1062,7 @@ class ActronAirAPI:
         # APK evidence (Retrofit base URL includes /api/v0/) resolves this to
         # /api/v0/messaging/connection/details.
         if self.platform == PLATFORM_NEO:
-            endpoint = "api/v0/messaging/connection/details"
+            endpoint = API_PATH_REALTIME_DETAILS
             try:
                 payload = await self._make_request("get", endpoint)
                 details = self._parse_realtime_details_payload(payload)
@@ -713,7 +1078,7 @@ class ActronAirAPI:
         # Que fallback endpoint from documented SignalR path.
         if self.platform == PLATFORM_QUE:
             return RealtimeConnectionDetails(
-                endpoint=f"{self.base_url.rstrip('/')}/api/v0/messaging/app",
+                endpoint=self._url_prefix + API_PATH_REALTIME_APP,
                 port=443,
                 protocol="https",
                 user_id="unknown",
@@ -806,6 +1171,9 @@ class ActronAirAPI:
         if not serial:
             return None
 
+        # Before any refresh below, so it cannot be answered from the cache
+        self._invalidate_status(serial)
+
         if self._is_mqtt_status_change_topic(event.topic):
             return await self._merge_mqtt_status_change(serial, event.payload)
 
@@ -1000,20 +1368,30 @@ class ActronAirAPI:
         endpoint: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         headers: dict[str, str] | None = None,
-        _retry: bool = True,
+        decode_json: bool = True,
+        validators: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Make an API request with proper error handling.
 
+        Concurrent identical GET requests (same endpoint, params, headers and
+        validators) share a single in-flight request; callers that join an
+        existing request receive their own copy of the response.
+
         Args:
             method: HTTP method ("get", "post", etc.)
             endpoint: API endpoint (without base URL)
             params: URL parameters
             json_data: JSON body data
-            data: Form data
+            data: Form data or a pre-encoded request body
             headers: HTTP headers
-            _retry: Internal flag to prevent infinite retry loops
+            decode_json: Whether to decode the response body. When False the
+                body is drained (so the connection can be reused) but not
+                parsed, and an empty dict is returned.
+            validators: Cache validators (``etag``, ``last_modified``) from a
+                previous response. When given, the request is made conditional
+                and the dict is updated in place from the new response.
 
         Returns:
             API response as JSON
@@ -1021,77 +1399,324 @@ class ActronAirAPI:
         Raises:
             ActronAirAuthError: For authentication errors
             ActronAirAPIError: For API errors
+            _NotModifiedError: If a conditional request was answered with 304
 
         """
-        # Ensure API is initialized with valid tokens
-        await self._ensure_initialized()
+        if method.lower() != "get" or json_data is not None or data is not None or not decode_json:
+            return await self._send_request(
+                method, endpoint, params, json_data, data, headers, decode_json, validators
+            )
 
-        # Ensure we have a valid token
-        await self.oauth2_auth.ensure_token_valid()
-        await self._sync_realtime_access_token()
+        key: _InflightKey = (
+            endpoint,
+            tuple(sorted(params.items())) if params else (),
+            tuple(sorted(headers.items())) if headers else (),
+            # Only requests updating the same validators may share a response
+            None if validators is None else id(validators),
+        )
+        inflight = self._inflight_gets.get(key)
+        if inflight is not None:
+            return deepcopy(await asyncio.shield(inflight))
+
+        task = asyncio.ensure_future(
+            self._send_request(
+                method, endpoint, params, json_data, data, headers, decode_json, validators
+            )
+        )
+        self._inflight_gets[key] = task
+        task.add_done_callback(functools.partial(self._inflight_get_done, key))
+        return await asyncio.shield(task)
+
+    def _inflight_get_done(self, key: _InflightKey, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Remove a completed GET from the single-flight table."""
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every awaiter was cancelled
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        decode_json: bool = True,
+        validators: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Send a single API request, retrying transient failures.
+
+        Timeouts, dropped connections and server errors are only retried for
+        GET and HEAD; other methods (such as commands) may already have been
+        acted on, so they are only resent after a 429 or a failed connect.
 
-        auth_header = self.oauth2_auth.authorization_header
+        Args:
+            method: HTTP method ("get", "post", etc.)
+            endpoint: API endpoint (without base URL)
+            params: URL parameters
+            json_data: JSON body data
+            data: Form data or a pre-encoded request body
+            headers: HTTP headers
+            decode_json: Whether to decode the response body. When False the
+                body is drained (so the connection can be reused) but not
+                parsed, and an empty dict is returned.
+            validators: Cache validators for a conditional request, updated
+                in place from the response
+
+        Returns:
+            API response as JSON
+
+        Raises:
+            ActronAirAuthError: For authentication errors
+            ActronAirAPIError: For API errors
+            _NotModifiedError: If a conditional request was answered with 304
+
+        """
+        # Ensure API is initialized with valid tokens; the synchronous checks
+        # keep the steady state free of extra coroutine round-trips
+        if not self._initialized:
+            await self._ensure_initialized()
 
-        # Prepare the request — clone headers to avoid mutating caller's dict
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = dict(headers) if headers else {}
-        request_headers.update(auth_header)
+        # Ensure we have a valid token
+        oauth = self.oauth2_auth
+        if not oauth.is_token_valid or oauth.is_token_expiring_soon:
+            await oauth.ensure_token_valid()
+        if self._rt_client is not None:
+            await self._sync_realtime_access_token()
+
+        if validators:
+            conditional = {}
+            if "etag" in validators:
+                conditional["If-None-Match"] = validators["etag"]
+            if "last_modified" in validators:
+                conditional["If-Modified-Since"] = validators["last_modified"]
+            headers = {**headers, **conditional} if headers else conditional
+
+        sent_token, request_headers = self._request_headers(headers)
+
+        # Prepare the request
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            # Endpoints are fixed paths or HAL links that are already encoded
+            url = URL(self._url_prefix + endpoint.lstrip("/"), encoded=True)
+            self._url_cache[endpoint] = url
 
         # Get a session
         session = await self._get_session()
 
-        # Make the request
-        try:
-            async with session.request(
-                method, url, params=params, json=json_data, data=data, headers=request_headers
-            ) as response:
-                if response.status == 401:
-                    response_text = await response.text()
-                    safe_text = response_text[:MAX_ERROR_RESPONSE_LENGTH]
-
-                    # If we have a refresh token and haven't retried yet, attempt refresh
-                    if _retry and self.oauth2_auth.refresh_token:
-                        try:
-                            await self.oauth2_auth.refresh_access_token()
-                            await self._sync_realtime_access_token()
-                            return await self._make_request(
-                                method, endpoint, params, json_data, data, headers, _retry=False
+        # Fast-fail while the upstream API is known to be down
+        self._breaker.before()
+
+        # Pace requests; retries below are already spaced by their backoff
+        await self._limiter.acquire()
+
+        # Make the request, retrying transient failures with backoff and a
+        # rejected token once after refreshing it
+        last_attempt = HTTP_RETRY_ATTEMPTS - 1
+        idempotent = method.upper() in HTTP_IDEMPOTENT_METHODS
+        retry_statuses = HTTP_RETRY_STATUSES if idempotent else HTTP_RETRY_STATUSES_NON_IDEMPOTENT
+        attempt = 0
+        auth_retried = False
+        while True:
+            retry_after: float | None = None
+            try:
+                async with session.request(
+                    method, url, params=params, json=json_data, data=data, headers=request_headers
+                ) as response:
+                    self._limiter.observe(response.headers)
+
+                    if response.status == 401:
+                        self._breaker.on_success()
+
+                        # If we have a refresh token and haven't retried yet, attempt refresh
+                        if not auth_retried and oauth.refresh_token:
+                            auth_retried = True
+                            try:
+                                # Only the first coroutine to see this token rejected
+                                # refreshes; the rest reuse the token it obtained
+                                await oauth.refresh_access_token(sent_token)
+                                await self._sync_realtime_access_token()
+                            except ActronAirAuthError:
+                                raise
+                            except (
+                                aiohttp.ClientError,
+                                ValueError,
+                                TypeError,
+                                KeyError,
+                            ) as refresh_error:
+                                safe_text = await read_error_text(response)
+                                raise ActronAirAuthError(
+                                    f"Authentication failed and token refresh failed: {safe_text}"
+                                ) from refresh_error
+                            sent_token, request_headers = self._request_headers(headers)
+                            continue
+
+                        # The body is only needed for the error message
+                        safe_text = await read_error_text(response)
+                        raise ActronAirAuthError(f"Authentication failed: {safe_text}")
+
+                    if response.status in HTTP_RETRY_STATUSES:
+                        self._limiter.on_throttle()
+
+                    if response.status in retry_statuses and attempt < last_attempt:
+                        retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                        if retry_after:
+                            # Hold back every other caller too, not just this retry
+                            self._limiter.pause(retry_after)
+                        _LOGGER.debug(
+                            "Transient HTTP %s from %s %s (attempt %d/%d)",
+                            response.status,
+                            method.upper(),
+                            endpoint,
+                            attempt + 1,
+                            HTTP_RETRY_ATTEMPTS,
+                        )
+                    else:
+                        # 408 and 429 come from a healthy server asking us to back off
+                        if response.status >= 500:
+                            self._breaker.on_failure()
+                        else:
+                            self._breaker.on_success()
+
+                        if response.status == 304 and validators:
+                            raise _NotModifiedError
+
+                        if not 200 <= response.status < 300:
+                            response_text = await read_error_text(response)
+                            raise ActronAirAPIError(
+                                f"API request failed. "
+                                f"Status: {response.status}, "
+                                f"Response: {response_text}"
                             )
-                        except ActronAirAuthError:
-                            raise
-                        except (
-                            aiohttp.ClientError,
-                            ValueError,
-                            TypeError,
-                            KeyError,
-                        ) as refresh_error:
-                            raise ActronAirAuthError(
-                                f"Authentication failed and token refresh failed: {safe_text}"
-                            ) from refresh_error
-
-                    raise ActronAirAuthError(f"Authentication failed: {safe_text}")
-
-                if not 200 <= response.status < 300:
-                    response_text = await response.text()
+
+                        self._limiter.on_success()
+
+                        if validators is not None:
+                            self._store_validators(validators, response.headers)
+
+                        if response.status == 204:
+                            return {}
+
+                        if not decode_json:
+                            await response.read()
+                            return {}
+
+                        result: dict[str, Any] = await response.json(loads=_json.loads)
+                        return result
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # A failed connect never reached the server, so it is safe to resend
+                retryable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                if attempt == last_attempt or not retryable:
+                    self._breaker.on_failure()
+                    if isinstance(e, aiohttp.ClientError):
+                        raise ActronAirAPIError(f"Request failed: {str(e)}") from e
                     raise ActronAirAPIError(
-                        f"API request failed. "
-                        f"Status: {response.status}, "
-                        f"Response: {response_text[:MAX_ERROR_RESPONSE_LENGTH]}"
-                    )
+                        f"Request timed out: {method.upper()} {endpoint}"
+                    ) from e
+                _LOGGER.debug(
+                    "Transient error on %s %s (attempt %d/%d): %s",
+                    method.upper(),
+                    endpoint,
+                    attempt + 1,
+                    HTTP_RETRY_ATTEMPTS,
+                    e,
+                )
+            except aiohttp.ClientError as e:
+                raise ActronAirAPIError(f"Request failed: {str(e)}") from e
+
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+            attempt += 1
+
+    @staticmethod
+    def _store_validators(validators: dict[str, str], headers: Mapping[str, str]) -> None:
+        """Replace cache validators with those sent on a successful response.
 
-                if response.status == 204:
-                    return {}
+        Args:
+            validators: Validator dict to update in place
+            headers: Response headers
+
+        """
+        validators.clear()
+        etag = headers.get("ETag")
+        if etag:
+            validators["etag"] = etag
+        last_modified = headers.get("Last-Modified")
+        if last_modified:
+            validators["last_modified"] = last_modified
+
+    def _request_headers(
+        self, headers: dict[str, str] | None
+    ) -> tuple[str | None, Mapping[str, str]]:
+        """Build the headers for a request using the current access token.
+
+        The OAuth handler caches the ``Authorization`` header per token, and
+        caller-supplied headers are merged into a new dict, never mutated.
+
+        Args:
+            headers: Extra headers supplied by the caller
+
+        Returns:
+            Tuple of the access token being sent and the request headers
+
+        """
+        oauth = self.oauth2_auth
+        auth_header = oauth.cached_authorization_header
+        return oauth.access_token, {**headers, **auth_header} if headers else auth_header
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: float | None = None) -> float:
+        """Compute the delay before the next retry attempt.
+
+        Uses exponential backoff with full jitter. A server-provided
+        ``Retry-After`` value takes precedence, capped at the maximum delay.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Delay requested by the server, in seconds
+
+        Returns:
+            Delay in seconds
+
+        """
+        if retry_after is not None:
+            return min(retry_after, HTTP_RETRY_MAX_DELAY)
+        return random.uniform(0, min(HTTP_RETRY_MAX_DELAY, HTTP_RETRY_BASE_DELAY * 2**attempt))
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Parse a ``Retry-After`` header in delta-seconds or HTTP-date form.
+
+        Args:
+            value: Raw header value, if present
 
-                result: dict[str, Any] = await response.json()
-                return result
-        except aiohttp.ClientError as e:
-            raise ActronAirAPIError(f"Request failed: {str(e)}") from e
+        Returns:
+            Delay in seconds, or None if the header is absent or malformed
+
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
     # API Methods
 
     async def get_ac_systems(self) -> list[ActronAirSystemInfo]:
         """Retrieve all AC systems in the customer account.
 
+        The account inventory rarely changes, so results are reused for a short
+        period. Call :meth:`invalidate_systems_cache` to force a fresh fetch,
+        for example after pairing or removing a system.
+
         Returns:
             List of AC system information models
 
@@ -1099,8 +1724,13 @@ class ActronAirAPI:
             ActronAirAPIError: If response is missing required data
 
         """
+        if self._systems_cache is not None:
+            fetched_at, cached = self._systems_cache
+            if time.monotonic() - fetched_at < self._systems_cache_ttl:
+                return list(cached)
+
         response = await self._make_request(
-            "get", "api/v0/client/ac-systems", params={"includeNeo": "true"}
+            "get", API_PATH_AC_SYSTEMS, params={"includeNeo": "true"}
         )
 
         # Validate response structure
@@ -1116,19 +1746,61 @@ class ActronAirAPI:
             raise ActronAirAPIError("Invalid response: 'ac-system' is not a list")
 
         # Convert to Pydantic models
-        systems = [ActronAirSystemInfo(**system_data) for system_data in systems_data]
+        systems = _SYSTEMS_ADAPTER.validate_python(systems_data)
 
         # Store system info models for link resolution
         self.systems = systems
+        self._systems_cache = (time.monotonic(), list(systems))
         self._maybe_update_base_url_from_systems(systems)
 
         return systems
 
+    def invalidate_systems_cache(self) -> None:
+        """Discard the cached AC system list so the next fetch hits the API."""
+        self._systems_cache = None
+
+    def invalidate_status_cache(self, serial_number: str | None = None) -> None:
+        """Discard cached AC status so the next fetch hits the API.
+
+        Args:
+            serial_number: Serial number of the system to invalidate, or None
+                to discard the cached status of every system
+
+        """
+        if serial_number is None:
+            self._status_cache.clear()
+            for serial in list(self._status_generation):
+                self._invalidate_status(serial)
+        else:
+            self._invalidate_status(_normalize_serial(serial_number))
+
+    def _invalidate_status(self, serial_number: str) -> None:
+        """Discard the cached status of one system, including fetches in flight.
+
+        Args:
+            serial_number: Lowercased serial number of the AC system
+
+        """
+        self._status_cache.pop(serial_number, None)
+        self._status_generation[serial_number] = self._status_generation.get(serial_number, 0) + 1
+
+        # Later reads must not join a request sent before the change
+        endpoint = self._get_system_link(serial_number, "ac-status")
+        if endpoint:
+            for key in [key for key in self._inflight_gets if key[0] == endpoint]:
+                del self._inflight_gets[key]
+
     async def get_ac_status(self, serial_number: str) -> ActronAirStatus:
         """Retrieve the current status for a specific AC system.
 
         This replaces the events API which was disabled by Actron in July 2025.
 
+        The raw payload is reused for a few seconds so that several reads in
+        quick succession share one request. Once expired it is revalidated
+        with a conditional request, so an unchanged status costs a 304 rather
+        than a full download. Sending a command or receiving a realtime update
+        for the system discards it; see also :meth:`invalidate_status_cache`.
+
         Args:
             serial_number: Serial number of the AC system
 
@@ -1140,17 +1812,97 @@ class ActronAirAPI:
 
         """
         # Normalize serial number to lowercase for consistent lookup
-        serial_number = serial_number.lower()
+        serial_number = _normalize_serial(serial_number)
 
-        endpoint = self._get_system_link(serial_number, "ac-status")
-        if not endpoint:
-            raise ActronAirAPIError(f"No ac-status link found for system {serial_number}")
+        cached = self._status_cache.get(serial_number)
+        if cached is not None and time.monotonic() - cached[0] < self._status_cache_ttl:
+            payload = cached[1]
+        else:
+            endpoint = self._get_system_link(serial_number, "ac-status")
+            if not endpoint:
+                raise ActronAirAPIError(f"No ac-status link found for system {serial_number}")
+
+            # Revalidate an expired payload rather than downloading it again
+            validators = self._status_validators.setdefault(serial_number, {})
+            if cached is None:
+                validators.clear()
+            generation = self._status_generation.setdefault(serial_number, 0)
+            try:
+                payload = await self._make_request("get", endpoint, validators=validators)
+            except _NotModifiedError:
+                if cached is None:
+                    # Invalidated while the request was in flight; fetch in full
+                    payload = await self._make_request("get", endpoint)
+                else:
+                    payload = cached[1]
 
-        status_data = await self._make_request("get", endpoint)
-        status = ActronAirStatus(serial_number=serial_number, **status_data)
+            # A command or realtime update since the request was sent may have
+            # made this payload stale, so only cache it if there was none
+            if self._status_generation[serial_number] == generation:
+                self._status_cache[serial_number] = (time.monotonic(), payload)
+
+        # The cached payload is never handed out; each status gets its own copy
+        status_data = deepcopy(payload)
+        status_data["serial_number"] = serial_number
+        status = ActronAirStatus.model_validate(status_data)
         status._api = self  # Set API reference for command execution
         return status
 
+    async def get_ac_statuses(self, serials: list[str]) -> dict[str, ActronAirStatus | None]:
+        """Retrieve the current status for several AC systems concurrently.
+
+        Requests are issued in parallel over the shared session, bounded by the
+        connection pool size. A failure for one system does not abort the
+        others; its entry is ``None`` and the error is logged.
+
+        Args:
+            serials: Serial numbers of the AC systems
+
+        Returns:
+            Dictionary mapping lowercased serial numbers to status models,
+            or None where the request failed
+
+        Raises:
+            ActronAirAuthError: If authentication fails
+
+        """
+        keys = [_normalize_serial(serial) for serial in serials]
+        results = await self._fetch_ac_statuses(keys)
+
+        statuses: dict[str, ActronAirStatus | None] = {}
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, ActronAirAuthError):
+                raise result
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to fetch status for %s: %s", key, result)
+                statuses[key] = None
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                statuses[key] = result
+        return statuses
+
+    async def _fetch_ac_statuses(self, serials: list[str]) -> list[ActronAirStatus | BaseException]:
+        """Fetch the status of several systems concurrently.
+
+        Requests are bounded by the connection pool size and all of them run
+        to completion, whether or not some fail.
+
+        Args:
+            serials: Serial numbers of the AC systems
+
+        Returns:
+            The status model, or the exception raised, for each serial in order
+
+        """
+        semaphore = asyncio.Semaphore(HTTP_CONNECTION_LIMIT_PER_HOST)
+
+        async def _fetch(serial: str) -> ActronAirStatus:
+            async with semaphore:
+                return await self.get_ac_status(serial)
+
+        return await asyncio.gather(*(_fetch(serial) for serial in serials), return_exceptions=True)
+
     async def send_command(self, serial_number: str, command: dict[str, Any]) -> None:
         """Send a command to the specified AC system.
 
@@ -1166,7 +1918,7 @@ class ActronAirAPI:
             ActronAirAPIError: If command fails or system not found
 
         """
-        serial_number = serial_number.lower()
+        serial_number = _normalize_serial(serial_number)
 
         inner = command.get("command", {})
         if inner.get("type") == "set-settings" and self._coalescer.debounce_seconds > 0:
@@ -1177,6 +1929,9 @@ class ActronAirAPI:
     async def _send_command_direct(self, serial_number: str, command: dict[str, Any]) -> None:
         """Send a command directly to the API without coalescing.
 
+        Commands for the same system are serialised so they reach the API in
+        the order they were issued.
+
         Args:
             serial_number: Serial number of the AC system
             command: Dictionary containing the command details
@@ -1189,17 +1944,33 @@ class ActronAirAPI:
         if not endpoint:
             raise ActronAirAPIError(f"No commands link found for system {serial_number}")
 
-        await self._make_request(
-            "post",
-            endpoint,
-            json_data=command,
-            headers={"Content-Type": "application/json"},
-        )
+        body = _json.dumps_bytes(command)
+        lock = self._command_locks.get(serial_number)
+        if lock is None:
+            lock = self._command_locks[serial_number] = asyncio.Lock()
+
+        async with lock:
+            try:
+                await self._make_request(
+                    "post", endpoint, data=body, headers=_JSON_HEADERS, decode_json=False
+                )
+            finally:
+                # The command may have changed the system state either way
+                self._invalidate_status(serial_number)
 
     async def update_status(
         self, serial_number: str | None = None
     ) -> dict[str, ActronAirStatus | None]:
-        """Update the status of AC systems using event-based updates.
+        """Update the status of AC systems by polling their latest status.
+
+        Actron disabled the events API in July 2025, so delta polling is not
+        available. For incremental updates without refetching full status
+        payloads, use :meth:`start_push`, which receives change messages over
+        the realtime channel and merges them into the cached status.
+
+        When updating all systems, requests are issued concurrently, bounded
+        by the connection pool size. Every system that could be fetched is
+        updated; if any failed, the first error is then raised.
 
         Args:
             serial_number: Optional serial number to update specific system,
@@ -1208,6 +1979,10 @@ class ActronAirAPI:
         Returns:
             Dictionary mapping serial numbers to status models
 
+        Raises:
+            ActronAirAuthError: If authentication fails
+            ActronAirAPIError: If the status of a system cannot be fetched
+
         """
         if serial_number:
             # Update specific system
@@ -1215,17 +1990,25 @@ class ActronAirAPI:
             status = self.state_manager.get_status(serial_number)
             return {serial_number: status}
 
-        # Update all systems
-        if not self.systems:
+        # Update all systems concurrently
+        serials = [system.serial for system in self.systems if system.serial]
+        if not serials:
             return {}
 
+        outcomes = await self._fetch_ac_statuses(serials)
+
+        error: BaseException | None = None
         results: dict[str, ActronAirStatus | None] = {}
-        for system in self.systems:
-            if system.serial:
-                await self._update_system_status(system.serial)
-                status = self.state_manager.get_status(system.serial)
-                results[system.serial] = status
+        for serial, outcome in zip(serials, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                error = error or outcome
+                continue
+            # Process and store the status via the state manager so observers are notified
+            self.state_manager.process_status_update(serial, outcome)
+            results[serial] = self.state_manager.get_status(serial)
 
+        if error is not None:
+            raise error
         return results
 
     async def _update_system_status(self, serial_number: str) -> None:
@@ -9,8 +9,22 @@ BASE_URL_NIMBUS: Final[str] = "https://nimbus.actronair.com.au"
 BASE_URL_QUE: Final[str] = "https://que.actronair.com.au"
 BASE_URL_DEFAULT: Final[str] = BASE_URL_NIMBUS
 
+# Normalised (lowercase, hyphen-free) system types served by the Que platform
+NX_GEN_SYSTEM_TYPES: Final[frozenset[str]] = frozenset({"nxgen"})
+
+# API paths (relative to the platform base URL)
+API_PATH_AC_SYSTEMS: Final[str] = "api/v0/client/ac-systems"
+API_PATH_REALTIME_DETAILS: Final[str] = "api/v0/messaging/connection/details"
+API_PATH_REALTIME_APP: Final[str] = "api/v0/messaging/app"
+
 COMMAND_DEBOUNCE_SECONDS: Final[float] = 0.1
 
+# How long a fetched AC system list is reused before hitting the API again
+SYSTEMS_CACHE_TTL: Final[float] = 60.0  # seconds
+
+# How long a fetched AC status is reused; commands and realtime updates invalidate it
+STATUS_CACHE_TTL: Final[float] = 5.0  # seconds
+
 DEFAULT_MIN_SETPOINT: Final[float] = 16.0
 DEFAULT_MAX_SETPOINT: Final[float] = 30.0
 
@@ -32,11 +46,48 @@ FALLBACK_SUPPORTED_MODES: Final[tuple[str, ...]] = (
 # HTTP timeout defaults (seconds)
 HTTP_CONNECT_TIMEOUT: Final[float] = 10.0
 HTTP_TOTAL_TIMEOUT: Final[float] = 30.0
+HTTP_SOCK_READ_TIMEOUT: Final[float] = 20.0
+
+# HTTP connection pool defaults
+HTTP_CONNECTION_LIMIT: Final[int] = 10
+HTTP_CONNECTION_LIMIT_PER_HOST: Final[int] = 6
+HTTP_DNS_CACHE_TTL: Final[int] = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT: Final[float] = 75.0  # seconds
+
+# HTTP retry policy for transient failures (exponential backoff, full jitter)
+HTTP_RETRY_ATTEMPTS: Final[int] = 5
+HTTP_RETRY_BASE_DELAY: Final[float] = 0.5  # seconds
+HTTP_RETRY_MAX_DELAY: Final[float] = 20.0  # seconds
+# Request Timeout, Too Many Requests and gateway/server errors; other 4xx are final
+HTTP_RETRY_STATUSES: Final[frozenset[int]] = frozenset({408, 429, 500, 502, 503, 504})
+# Methods that are safe to resend after a timeout or server error
+HTTP_IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD"})
+# Statuses returned before a request is acted on, so commands may be resent too
+HTTP_RETRY_STATUSES_NON_IDEMPOTENT: Final[frozenset[int]] = frozenset({429})
+
+# Circuit breaker for sustained upstream outages
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final[int] = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT: Final[float] = 30.0  # seconds
+
+# Adaptive request pacing: additive increase on success, multiplicative
+# decrease when the server signals overload (429 / 5xx)
+RATE_LIMIT_INITIAL_RATE: Final[float] = 8.0  # requests per second
+RATE_LIMIT_MIN_RATE: Final[float] = 0.5  # requests per second
+RATE_LIMIT_MAX_RATE: Final[float] = 16.0  # requests per second
+RATE_LIMIT_BURST: Final[float] = 8.0  # requests
+RATE_LIMIT_INCREASE: Final[float] = 0.5  # requests per second
+RATE_LIMIT_DECREASE: Final[float] = 0.5  # multiplier
+# Pause once a reported X-RateLimit-Remaining drops below this share of the limit
+RATE_LIMIT_QUOTA_THRESHOLD: Final[float] = 0.1
+RATE_LIMIT_MAX_PAUSE: Final[float] = 60.0  # seconds
 
 # OAuth2 defaults
 OAUTH_CLIENT_ID: Final[str] = "home_assistant"
 OAUTH_TOKEN_REFRESH_MARGIN: Final[int] = 900  # 15 minutes in seconds
 OAUTH_DEFAULT_EXPIRY: Final[int] = 3600  # 1 hour in seconds
+OAUTH_POLL_JITTER: Final[float] = 0.5  # max extra seconds added to each poll wait
+OAUTH_SLOW_DOWN_INCREMENT: Final[int] = 5  # RFC 8628 section 3.5
+OAUTH_POLL_REQUEST_TIMEOUT: Final[float] = 10.0  # max seconds for one token poll request
 
 # Temperature validation
 TEMP_PHYSICAL_MIN: Final[float] = -50.0
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from ..const import OAUTH_DEFAULT_EXPIRY
 
 
 class ActronAirDeviceCode(BaseModel):
@@ -17,16 +21,94 @@ class ActronAirDeviceCode(BaseModel):
     expires_in: int = Field(..., description="Expiration time in seconds")
     interval: int = Field(..., description="Polling interval in seconds")
 
+    @model_validator(mode="before")
+    @classmethod
+    def default_verification_uri_complete(cls, data: Any) -> Any:
+        """Derive verification_uri_complete when the server omits it.
+
+        Args:
+            data: Raw device code response
+
+        Returns:
+            The response with verification_uri_complete filled in if possible
+
+        """
+        if (
+            isinstance(data, dict)
+            and "verification_uri_complete" not in data
+            and "verification_uri" in data
+            and "user_code" in data
+        ):
+            data = {
+                **data,
+                "verification_uri_complete": (
+                    f"{data['verification_uri']}?user_code={data['user_code']}"
+                ),
+            }
+        return data
+
 
 class ActronAirToken(BaseModel):
     """OAuth2 token response model."""
 
-    access_token: str = Field(..., description="Access token")
+    access_token: str = Field(..., min_length=1, description="Access token")
     refresh_token: str | None = Field(None, description="Refresh token")
     token_type: str = Field("Bearer", description="Token type")
-    expires_in: int = Field(3600, description="Expiration time in seconds")
+    expires_in: int = Field(OAUTH_DEFAULT_EXPIRY, description="Expiration time in seconds")
     scope: str | None = Field(None, description="Token scope")
 
+    @field_validator("refresh_token", mode="before")
+    @classmethod
+    def ignore_invalid_refresh_token(cls, v: Any) -> Any:
+        """Treat a missing, empty or non-string refresh token as absent.
+
+        Args:
+            v: Raw refresh token value
+
+        Returns:
+            The refresh token, or None if it is unusable
+
+        """
+        return v if isinstance(v, str) and v else None
+
+    @field_validator("token_type", mode="before")
+    @classmethod
+    def default_token_type(cls, v: Any) -> Any:
+        """Fall back to ``Bearer`` when the token type is missing or not a string.
+
+        Args:
+            v: Raw token type value
+
+        Returns:
+            The token type, or ``Bearer`` if it is unusable
+
+        """
+        return v if isinstance(v, str) and v else "Bearer"
+
+    @field_validator("expires_in", mode="before")
+    @classmethod
+    def default_expires_in(cls, v: Any) -> Any:
+        """Fall back to the default lifetime for empty or unparseable strings.
+
+        Numeric strings are coerced by pydantic as usual; values of any other
+        unexpected type are left to fail validation.
+
+        Args:
+            v: Raw expires_in value
+
+        Returns:
+            The expiry value to validate
+
+        """
+        if not v:
+            return OAUTH_DEFAULT_EXPIRY
+        if isinstance(v, str):
+            try:
+                return int(v)
+            except ValueError:
+                return OAUTH_DEFAULT_EXPIRY
+        return v
+
 
 class ActronAirUserInfo(BaseModel):
     """User information model."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -33,6 +34,37 @@ _MODE_SUPPORT_MAP: dict[str, str] = {
     "Dry": AC_MODE_DRY,
 }
 
+# Command keys for the system-wide setpoints
+_SETPOINT_COOL_KEY = "UserAirconSettings.TemperatureSetpoint_Cool_oC"
+_SETPOINT_HEAT_KEY = "UserAirconSettings.TemperatureSetpoint_Heat_oC"
+
+# Setpoint key written by each single-setpoint mode
+_SETPOINT_KEYS: dict[str, str] = {
+    AC_MODE_COOL: _SETPOINT_COOL_KEY,
+    AC_MODE_HEAT: _SETPOINT_HEAT_KEY,
+}
+
+# NV_Limits (min, max) keys bounding the setpoint of each single-setpoint mode
+_SETPOINT_LIMIT_KEYS: dict[str, tuple[str, str]] = {
+    AC_MODE_COOL: ("setCool_Min", "setCool_Max"),
+    AC_MODE_HEAT: ("setHeat_Min", "setHeat_Max"),
+}
+
+
+def _setting_command(key: str, value: Any) -> dict[str, Any]:
+    """Build a ``set-settings`` command that changes a single setting."""
+    return {"command": {key: value, "type": "set-settings"}}
+
+
+@functools.cache
+def _fields_by_alias() -> dict[str, str]:
+    """Map each ``UserAirconSettings`` API key to its model field name."""
+    return {
+        field.alias: name
+        for name, field in ActronAirUserAirconSettings.model_fields.items()
+        if field.alias
+    }
+
 
 class ActronAirModeSupport(BaseModel):
     """Mode support flags from the AC system.
@@ -88,6 +120,18 @@ class ActronAirUserAirconSettings(BaseModel):
         """
         self._parent_status = parent
 
+    def _command_target(self) -> tuple[Any, str]:
+        """Return the API client and serial number that commands are sent to.
+
+        Raises:
+            ValueError: If no API reference or serial number is available
+
+        """
+        parent = self._parent_status
+        if not parent or not parent.api or not parent.serial_number:
+            raise ValueError("No API reference available to send command")
+        return parent.api, parent.serial_number
+
     @property
     def supported_modes(self) -> list[str]:
         """Get the list of HVAC modes supported by this system.
@@ -199,21 +243,15 @@ class ActronAirUserAirconSettings(BaseModel):
         # Determine if system should be on or off based on mode
         is_on = mode.upper() != AC_MODE_OFF
 
-        command = {
+        # When turning off, preserve the current mode, otherwise set the new mode
+        return {
             "command": {
                 "UserAirconSettings.isOn": is_on,
+                "UserAirconSettings.Mode": mode if is_on else self.mode,
                 "type": "set-settings",
             }
         }
 
-        # When turning off, preserve the current mode, otherwise set the new mode
-        if not is_on:
-            command["command"]["UserAirconSettings.Mode"] = self.mode
-        else:
-            command["command"]["UserAirconSettings.Mode"] = mode
-
-        return command
-
     def _set_fan_mode_command(self, fan_mode: str) -> dict[str, Any]:
         """Create a command to set the fan mode, preserving continuous mode setting.
 
@@ -229,12 +267,7 @@ class ActronAirUserAirconSettings(BaseModel):
         if self.continuous_fan_enabled:
             mode = f"{fan_mode}+CONT"
 
-        return {
-            "command": {
-                "UserAirconSettings.FanMode": mode,
-                "type": "set-settings",
-            }
-        }
+        return _setting_command("UserAirconSettings.FanMode", mode)
 
     def _set_continuous_mode_command(self, enabled: bool) -> dict[str, Any]:
         """Create a command to enable/disable continuous fan mode.
@@ -249,12 +282,7 @@ class ActronAirUserAirconSettings(BaseModel):
         base_mode = self.base_fan_mode
         mode = f"{base_mode}+CONT" if enabled else base_mode
 
-        return {
-            "command": {
-                "UserAirconSettings.FanMode": mode,
-                "type": "set-settings",
-            }
-        }
+        return _setting_command("UserAirconSettings.FanMode", mode)
 
     def _set_temperature_command(self, temperature: float) -> dict[str, Any]:
         """Create a command to set temperature for the system based on the current AC mode.
@@ -274,29 +302,22 @@ class ActronAirUserAirconSettings(BaseModel):
         if mode in (AC_MODE_FAN, AC_MODE_OFF):
             raise ValueError(f"Cannot set temperature in {mode} mode")
 
-        command: dict[str, Any] = {"command": {"type": "set-settings"}}
+        inner: dict[str, Any] = {"type": "set-settings"}
 
-        if mode == AC_MODE_COOL:
-            command["command"]["UserAirconSettings.TemperatureSetpoint_Cool_oC"] = float(
-                temperature
-            )
-        elif mode == AC_MODE_HEAT:
-            command["command"]["UserAirconSettings.TemperatureSetpoint_Heat_oC"] = float(
-                temperature
-            )
-        elif mode == AC_MODE_AUTO:
+        if mode == AC_MODE_AUTO:
             # AUTO: maintain the temperature differential between cooling and heating
             differential = self.temperature_setpoint_cool_c - self.temperature_setpoint_heat_c
 
             # Apply the same differential to the new temperature
             # For AUTO mode, we assume the provided temperature is for cooling
-            cool_setpoint = float(temperature)
-            heat_setpoint = float(max(TEMP_AUTO_HEAT_MIN, temperature - differential))
-
-            command["command"]["UserAirconSettings.TemperatureSetpoint_Cool_oC"] = cool_setpoint
-            command["command"]["UserAirconSettings.TemperatureSetpoint_Heat_oC"] = heat_setpoint
+            inner[_SETPOINT_COOL_KEY] = float(temperature)
+            inner[_SETPOINT_HEAT_KEY] = float(max(TEMP_AUTO_HEAT_MIN, temperature - differential))
+        else:
+            key = _SETPOINT_KEYS.get(mode)
+            if key is not None:
+                inner[key] = float(temperature)
 
-        return command
+        return {"command": inner}
 
     def _set_away_mode_command(self, enabled: bool = False) -> dict[str, Any]:
         """Create a command to enable/disable away mode.
@@ -308,12 +329,7 @@ class ActronAirUserAirconSettings(BaseModel):
             Command dictionary
 
         """
-        return {
-            "command": {
-                "UserAirconSettings.AwayMode": enabled,
-                "type": "set-settings",
-            }
-        }
+        return _setting_command("UserAirconSettings.AwayMode", enabled)
 
     def _set_quiet_mode_command(self, enabled: bool = False) -> dict[str, Any]:
         """Create a command to enable/disable quiet mode.
@@ -325,12 +341,7 @@ class ActronAirUserAirconSettings(BaseModel):
             Command dictionary
 
         """
-        return {
-            "command": {
-                "UserAirconSettings.QuietModeEnabled": enabled,
-                "type": "set-settings",
-            }
-        }
+        return _setting_command("UserAirconSettings.QuietModeEnabled", enabled)
 
     def _set_turbo_mode_command(self, enabled: bool = False) -> dict[str, Any]:
         """Create a command to enable/disable turbo mode.
@@ -342,12 +353,28 @@ class ActronAirUserAirconSettings(BaseModel):
             Command dictionary
 
         """
-        return {
-            "command": {
-                "UserAirconSettings.TurboMode.Enabled": enabled,
-                "type": "set-settings",
-            }
+        return _setting_command("UserAirconSettings.TurboMode.Enabled", enabled)
+
+    def _set_settings_command(self, settings: dict[str, Any]) -> dict[str, Any]:
+        """Build a single ``set-settings`` command that changes several settings.
+
+        Args:
+            settings: New values keyed by their ``UserAirconSettings`` API name
+
+        Returns:
+            Command dictionary ready for ``send_command``
+
+        Raises:
+            ValueError: If no settings are given
+
+        """
+        if not settings:
+            raise ValueError("At least one setting must be provided")
+        inner: dict[str, Any] = {
+            f"UserAirconSettings.{key}": value for key, value in settings.items()
         }
+        inner["type"] = "set-settings"
+        return {"command": inner}
 
     async def set_system_mode(self, mode: str) -> None:
         """Set the AC system mode and send the command.
@@ -361,17 +388,15 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_system_mode_command(mode)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
-
-            # Optimistic local state update
-            if mode.upper() == AC_MODE_OFF:
-                self.is_on = False
-            else:
-                self.is_on = True
-                self.mode = mode
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
+
+        # Optimistic local state update
+        if mode.upper() == AC_MODE_OFF:
+            self.is_on = False
         else:
-            raise ValueError("No API reference available to send command")
+            self.is_on = True
+            self.mode = mode
 
     async def set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode and send the command. Preserves current continuous mode setting.
@@ -384,16 +409,14 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_fan_mode_command(fan_mode)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            # Capture optimistic value before await to avoid races
-            optimistic_fan = f"{fan_mode}+CONT" if self.continuous_fan_enabled else fan_mode
+        api, serial_number = self._command_target()
+        # Capture optimistic value before await to avoid races
+        optimistic_fan = f"{fan_mode}+CONT" if self.continuous_fan_enabled else fan_mode
 
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
+        await api.send_command(serial_number, command)
 
-            # Optimistic local state update
-            self.fan_mode = optimistic_fan
-        else:
-            raise ValueError("No API reference available to send command")
+        # Optimistic local state update
+        self.fan_mode = optimistic_fan
 
     async def set_continuous_mode(self, enabled: bool) -> None:
         """Enable or disable continuous fan mode and send the command.
@@ -406,17 +429,15 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_continuous_mode_command(enabled)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            # Capture optimistic value before await to avoid races
-            base = self.base_fan_mode
-            optimistic_fan = f"{base}+CONT" if enabled else base
+        api, serial_number = self._command_target()
+        # Capture optimistic value before await to avoid races
+        base = self.base_fan_mode
+        optimistic_fan = f"{base}+CONT" if enabled else base
 
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
+        await api.send_command(serial_number, command)
 
-            # Optimistic local state update
-            self.fan_mode = optimistic_fan
-        else:
-            raise ValueError("No API reference available to send command")
+        # Optimistic local state update
+        self.fan_mode = optimistic_fan
 
     async def set_temperature(self, temperature: float) -> None:
         """Set temperature for the system based on the current AC mode and send the command.
@@ -438,44 +459,29 @@ class ActronAirUserAirconSettings(BaseModel):
             )
 
         # Apply limits if they are available
-        if self._parent_status and self._parent_status.last_known_state:
+        limit_keys = _SETPOINT_LIMIT_KEYS.get(self.mode.upper())
+        if limit_keys and self._parent_status and self._parent_status.last_known_state:
             limits = self._parent_status.last_known_state.get("NV_Limits", {}).get(
                 "UserSetpoint_oC", {}
             )
-
-            if self.mode.upper() == AC_MODE_COOL:
-                min_temp = limits.get("setCool_Min", DEFAULT_MIN_SETPOINT)
-                max_temp = limits.get("setCool_Max", DEFAULT_MAX_SETPOINT)
-                temperature = max(min_temp, min(max_temp, temperature))
-            elif self.mode.upper() == AC_MODE_HEAT:
-                min_temp = limits.get("setHeat_Min", DEFAULT_MIN_SETPOINT)
-                max_temp = limits.get("setHeat_Max", DEFAULT_MAX_SETPOINT)
-                temperature = max(min_temp, min(max_temp, temperature))
+            min_temp = limits.get(limit_keys[0], DEFAULT_MIN_SETPOINT)
+            max_temp = limits.get(limit_keys[1], DEFAULT_MAX_SETPOINT)
+            temperature = max(min_temp, min(max_temp, temperature))
 
         command = self._set_temperature_command(temperature)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            # Capture optimistic values before await to avoid races
-            mode = self.mode.upper()
-            optimistic_cool: float | None = None
-            optimistic_heat: float | None = None
-            if mode == AC_MODE_COOL:
-                optimistic_cool = temperature
-            elif mode == AC_MODE_HEAT:
-                optimistic_heat = temperature
-            elif mode == AC_MODE_AUTO:
-                differential = self.temperature_setpoint_cool_c - self.temperature_setpoint_heat_c
-                optimistic_cool = temperature
-                optimistic_heat = max(TEMP_AUTO_HEAT_MIN, temperature - differential)
-
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
-
-            # Optimistic local state update
-            if optimistic_cool is not None:
-                self.temperature_setpoint_cool_c = optimistic_cool
-            if optimistic_heat is not None:
-                self.temperature_setpoint_heat_c = optimistic_heat
-        else:
-            raise ValueError("No API reference available to send command")
+        api, serial_number = self._command_target()
+        # Capture optimistic values before await to avoid races
+        inner = command["command"]
+        optimistic_cool: float | None = inner.get(_SETPOINT_COOL_KEY)
+        optimistic_heat: float | None = inner.get(_SETPOINT_HEAT_KEY)
+
+        await api.send_command(serial_number, command)
+
+        # Optimistic local state update
+        if optimistic_cool is not None:
+            self.temperature_setpoint_cool_c = optimistic_cool
+        if optimistic_heat is not None:
+            self.temperature_setpoint_heat_c = optimistic_heat
 
     async def set_away_mode(self, enabled: bool = False) -> None:
         """Enable/disable away mode and send the command.
@@ -488,13 +494,11 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_away_mode_command(enabled)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
 
-            # Optimistic local state update
-            self.away_mode = enabled
-        else:
-            raise ValueError("No API reference available to send command")
+        # Optimistic local state update
+        self.away_mode = enabled
 
     async def set_quiet_mode(self, enabled: bool = False) -> None:
         """Enable/disable quiet mode and send the command.
@@ -507,13 +511,11 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_quiet_mode_command(enabled)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
 
-            # Optimistic local state update
-            self.quiet_mode_enabled = enabled
-        else:
-            raise ValueError("No API reference available to send command")
+        # Optimistic local state update
+        self.quiet_mode_enabled = enabled
 
     async def set_turbo_mode(self, enabled: bool = False) -> None:
         """Enable/disable turbo mode and send the command.
@@ -526,13 +528,44 @@ class ActronAirUserAirconSettings(BaseModel):
 
         """
         command = self._set_turbo_mode_command(enabled)
-        if self._parent_status and self._parent_status.api and self._parent_status.serial_number:
-            await self._parent_status.api.send_command(self._parent_status.serial_number, command)
-
-            # Optimistic local state update
-            if isinstance(self.turbo_mode_enabled, dict):
-                self.turbo_mode_enabled["Enabled"] = enabled
-            else:
-                self.turbo_mode_enabled = enabled
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
+
+        # Optimistic local state update
+        if isinstance(self.turbo_mode_enabled, dict):
+            self.turbo_mode_enabled["Enabled"] = enabled
         else:
-            raise ValueError("No API reference available to send command")
+            self.turbo_mode_enabled = enabled
+
+    async def set_settings(self, **settings: Any) -> None:
+        """Change several settings with one command and a single API call.
+
+        Keys are ``UserAirconSettings`` API names, for example
+        ``await settings.set_settings(isOn=True, Mode="COOL")``. Values for
+        keys that match a field of this model are checked against its type
+        before anything is sent.
+
+        After successful command delivery those fields are updated
+        optimistically. Other keys (such as dotted sub-settings) are sent
+        unchecked and leave the local state unchanged.
+
+        Args:
+            **settings: New values keyed by their ``UserAirconSettings`` API name
+
+        Raises:
+            ValueError: If no settings are given, a value has the wrong type,
+                or no API reference is available
+
+        """
+        command = self._set_settings_command(settings)
+        fields_by_alias = _fields_by_alias()
+        known = {key: value for key, value in settings.items() if key in fields_by_alias}
+        # Strict, so the value stored locally is exactly the one sent
+        validated = ActronAirUserAirconSettings.model_validate(known, strict=True)
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
+
+        # Optimistic local state update
+        for key in known:
+            field_name = fields_by_alias[key]
+            setattr(self, field_name, getattr(validated, field_name))
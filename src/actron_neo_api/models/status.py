@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from ..const import AC_MODE_HEAT, DEFAULT_MAX_SETPOINT, DEFAULT_MIN_SETPOINT
 from .settings import ActronAirUserAirconSettings
@@ -16,6 +16,9 @@ from .zone import ActronAirPeripheral, ActronAirZone
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validates the whole RemoteZoneInfo list in one pydantic-core call
+_ZONE_LIST_ADAPTER: Final[TypeAdapter[list[ActronAirZone]]] = TypeAdapter(list[ActronAirZone])
+
 
 class ActronAirStatus(BaseModel):
     """Complete status model for an Actron Air AC system.
@@ -59,6 +62,26 @@ class ActronAirStatus(BaseModel):
         """
         return dict(enumerate(self.remote_zone_info))
 
+    @property
+    def active_zones(self) -> list[bool]:
+        """Return the active flag of every zone in a single pass.
+
+        Equivalent to ``[zone.is_active for zone in self.remote_zone_info]``
+        without re-reading the enabled-zones list for each zone.
+
+        Returns:
+            List aligned with ``remote_zone_info``; True where the zone is
+            enabled and can operate
+
+        """
+        enabled_zones = self.user_aircon_settings.enabled_zones
+        active = [
+            zone.can_operate and enabled
+            for zone, enabled in zip(self.remote_zone_info, enabled_zones, strict=False)
+        ]
+        active.extend([False] * (len(self.remote_zone_info) - len(active)))
+        return active
+
     @property
     def clean_filter(self) -> bool:
         """Clean filter alert status."""
@@ -153,7 +176,7 @@ class ActronAirStatus(BaseModel):
 
         # Peripherals live under AirconSystem but are parsed independently
         # so they survive even when the ACSystem model itself is invalid.
-        self._process_peripherals()
+        self._process_peripherals(aircon_system_data)
 
         try:
             self.ac_system = ActronAirACSystem.model_validate(aircon_system_data)
@@ -165,16 +188,15 @@ class ActronAirStatus(BaseModel):
         nv_system_settings = self.last_known_state.get("NV_SystemSettings")
         if isinstance(nv_system_settings, dict):
             system_name = nv_system_settings.get("SystemName", "")
-            if system_name and self.ac_system:
+            if system_name:
                 self.ac_system.system_name = system_name
 
         # Set serial number from the AirconSystem data
-        if self.ac_system and self.ac_system.master_serial:
+        if self.ac_system.master_serial:
             self.serial_number = self.ac_system.master_serial
 
         # Set parent reference for ACSystem
-        if self.ac_system:
-            self.ac_system.set_parent_status(self)
+        self.ac_system.set_parent_status(self)
 
     def _parse_user_aircon_settings(self) -> None:
         """Parse UserAirconSettings data from last_known_state."""
@@ -189,8 +211,7 @@ class ActronAirStatus(BaseModel):
             _LOGGER.warning("Failed to parse UserAirconSettings: %s", e)
             return
         # Set parent reference
-        if self.user_aircon_settings:
-            self.user_aircon_settings.set_parent_status(self)
+        self.user_aircon_settings.set_parent_status(self)
 
     def _parse_master_info(self) -> None:
         """Parse MasterInfo data from last_known_state."""
@@ -237,17 +258,13 @@ class ActronAirStatus(BaseModel):
             )
             return
         try:
-            self.remote_zone_info = [
-                ActronAirZone.model_validate({**zone, "zone_id": i})
-                for i, zone in enumerate(remote_zone_data)
-            ]
+            self.remote_zone_info = _ZONE_LIST_ADAPTER.validate_python(
+                [{**zone, "zone_id": i} for i, zone in enumerate(remote_zone_data)],
+                context={"parent_status": self},
+            )
         except (ValidationError, ValueError, TypeError) as e:
             _LOGGER.warning("Failed to parse RemoteZoneInfo: %s", e)
             self.remote_zone_info = []
-            return
-        # Set parent reference for each zone
-        for zone in self.remote_zone_info:
-            zone.set_parent_status(self)
 
     def set_api(self, api: Any) -> None:
         """Set the API reference to enable direct command sending.
@@ -308,14 +325,17 @@ class ActronAirStatus(BaseModel):
         except (KeyError, TypeError, ValueError):
             return DEFAULT_MAX_SETPOINT
 
-    def _process_peripherals(self) -> None:
-        """Process peripheral devices from the last_known_state and extract their sensor data.
+    def _process_peripherals(self, aircon_system: dict[str, Any]) -> None:
+        """Process peripheral devices from the AirconSystem data and extract their sensor data.
 
         Peripherals are additional sensors (temperature, humidity) that can be assigned
         to zones. This method creates ActronAirPeripheral objects from the raw data
         and maps their readings to the appropriate zones.
+
+        Args:
+            aircon_system: The AirconSystem section of last_known_state
+
         """
-        aircon_system = self.last_known_state.get("AirconSystem", {})
         peripherals_data = aircon_system.get("Peripherals")
 
         if not peripherals_data:
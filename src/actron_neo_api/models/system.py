@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Annotated, Any, Final
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, StringConstraints
 
 from ..const import AC_MODE_AUTO, AC_MODE_COOL, AC_MODE_DRY, AC_MODE_FAN, AC_MODE_HEAT, AC_MODE_OFF
 
 if TYPE_CHECKING:
     from .status import ActronAirStatus
 
+_VALID_MODES: Final[frozenset[str]] = frozenset(
+    {AC_MODE_COOL, AC_MODE_HEAT, AC_MODE_AUTO, AC_MODE_FAN, AC_MODE_DRY, AC_MODE_OFF}
+)
+_VALID_MODES_TEXT: Final[str] = ", ".join(sorted(_VALID_MODES))
+
 
 class ActronAirSystemInfo(BaseModel):
     """Basic system information from get_ac_systems API.
@@ -18,26 +23,17 @@ class ActronAirSystemInfo(BaseModel):
     Contains system identification and API endpoint links.
     """
 
-    serial: str = Field(..., description="System serial number")
+    # Lower-cased by pydantic-core during validation, without a Python callback
+    serial: Annotated[str, StringConstraints(to_lower=True)] = Field(
+        ..., description="System serial number"
+    )
     type: str | None = Field(None, description="System type (e.g., 'standard', 'NX-Gen')")
-    links: dict[str, Any] = Field(default_factory=dict, alias="_links")
+    # HAL links are free-form JSON read defensively by the client, so they are
+    # stored as received rather than walked by the validator
+    links: SkipValidation[dict[str, Any]] = Field(default_factory=dict, alias="_links")
 
     model_config = ConfigDict(populate_by_name=True)
 
-    @field_validator("serial")
-    @classmethod
-    def normalize_serial(cls, v: str) -> str:
-        """Normalize serial number to lowercase.
-
-        Args:
-            v: Serial number string
-
-        Returns:
-            Lowercase serial number
-
-        """
-        return v.lower() if v else v
-
 
 class ActronAirOutdoorUnit(BaseModel):
     """Outdoor unit data for an Actron Air AC system.
@@ -46,6 +42,8 @@ class ActronAirOutdoorUnit(BaseModel):
     compressor speed, power consumption, and operational status.
     """
 
+    model_config = ConfigDict(populate_by_name=True)
+
     model_number: str = Field("", alias="ModelNumber")
     serial_number: str = Field("", alias="SerialNumber")
     software_version: str = Field("", alias="SoftwareVersion")
@@ -178,19 +176,10 @@ class ActronAirACSystem(BaseModel):
         if not mode or not isinstance(mode, str):
             raise ValueError("Mode must be a non-empty string")
 
-        valid_modes = {
-            AC_MODE_COOL,
-            AC_MODE_HEAT,
-            AC_MODE_AUTO,
-            AC_MODE_FAN,
-            AC_MODE_DRY,
-            AC_MODE_OFF,
-        }
-        mode_upper = mode.upper().strip()
-        if mode_upper not in valid_modes:
-            raise ValueError(
-                f"Invalid mode '{mode}'. Must be one of: {', '.join(sorted(valid_modes))}"
-            )
+        # Callers almost always pass a canonical constant; skip normalising it
+        mode_upper = mode if mode in _VALID_MODES else mode.strip().upper()
+        if mode_upper not in _VALID_MODES:
+            raise ValueError(f"Invalid mode '{mode}'. Must be one of: {_VALID_MODES_TEXT}")
 
         if not self._parent_status or not self._parent_status.api:
             raise ValueError("No API reference available")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +24,18 @@ _LOGGER = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from .status import ActronAirStatus
 
+# Position in a zone's (cool, heat) setpoint keys for each single-setpoint mode
+_SETPOINT_KEY_INDEX: dict[str, int] = {AC_MODE_COOL: 0, AC_MODE_HEAT: 1}
+
+
+@functools.lru_cache(maxsize=32)
+def _zone_setpoint_keys(zone_id: int) -> tuple[str, str]:
+    """Return the (cool, heat) setpoint command keys for a zone."""
+    return (
+        f"RemoteZoneInfo[{zone_id}].TemperatureSetpoint_Cool_oC",
+        f"RemoteZoneInfo[{zone_id}].TemperatureSetpoint_Heat_oC",
+    )
+
 
 class ActronAirZoneSensor(BaseModel):
     """Sensor data for a zone controller.
@@ -152,6 +165,18 @@ class ActronAirZone(BaseModel):
     zone_id: int
     _parent_status: "ActronAirStatus | None" = None
 
+    def model_post_init(self, __context: Any) -> None:
+        """Attach the parent status supplied in the validation context.
+
+        ``ActronAirStatus`` passes itself as ``parent_status`` when it
+        validates ``RemoteZoneInfo``, so zones are linked during the same
+        pass that builds them.
+        """
+        if isinstance(__context, dict):
+            parent = __context.get("parent_status")
+            if parent is not None:
+                self._parent_status = parent
+
     @property
     def parent_status(self) -> "ActronAirStatus":
         """Get the parent status object.
@@ -271,38 +296,33 @@ class ActronAirZone(BaseModel):
             Command dictionary
 
         """
-        if not self.parent_status.user_aircon_settings.mode:
+        settings = self.parent_status.user_aircon_settings
+        if not settings.mode:
             raise ValueError("No AC mode available to determine temperature setpoint")
 
-        mode = self.parent_status.user_aircon_settings.mode.upper()
+        mode = settings.mode.upper()
 
         if mode in (AC_MODE_FAN, AC_MODE_OFF):
             raise ValueError(f"Cannot set temperature in {mode} mode")
 
+        keys = _zone_setpoint_keys(self.zone_id)
         command: dict[str, Any] = {"type": "set-settings"}
 
-        if mode == AC_MODE_COOL:
-            command[f"RemoteZoneInfo[{self.zone_id}].TemperatureSetpoint_Cool_oC"] = float(
-                temperature
-            )
-        elif mode == AC_MODE_HEAT:
-            command[f"RemoteZoneInfo[{self.zone_id}].TemperatureSetpoint_Heat_oC"] = float(
-                temperature
-            )
-        elif mode == AC_MODE_AUTO:
+        if mode == AC_MODE_AUTO:
             # AUTO: maintain the temperature differential between cooling and heating
             # Get the current differential from parent settings
-            cool_temp = self.parent_status.user_aircon_settings.temperature_setpoint_cool_c
-            heat_temp = self.parent_status.user_aircon_settings.temperature_setpoint_heat_c
-            differential = cool_temp - heat_temp
+            differential = (
+                settings.temperature_setpoint_cool_c - settings.temperature_setpoint_heat_c
+            )
 
             # Apply the same differential to the new temperature
             # For AUTO mode, we assume the provided temperature is for cooling
-            cool_setpoint = float(temperature)
-            heat_setpoint = float(max(TEMP_AUTO_HEAT_MIN, temperature - differential))
-
-            command[f"RemoteZoneInfo[{self.zone_id}].TemperatureSetpoint_Cool_oC"] = cool_setpoint
-            command[f"RemoteZoneInfo[{self.zone_id}].TemperatureSetpoint_Heat_oC"] = heat_setpoint
+            command[keys[0]] = float(temperature)
+            command[keys[1]] = float(max(TEMP_AUTO_HEAT_MIN, temperature - differential))
+        else:
+            index = _SETPOINT_KEY_INDEX.get(mode)
+            if index is not None:
+                command[keys[index]] = float(temperature)
 
         return {"command": command}
 
@@ -341,6 +361,19 @@ class ActronAirZone(BaseModel):
         """
         self._parent_status = parent
 
+    def _command_target(self) -> tuple[Any, str]:
+        """Return the API client and serial number that commands are sent to.
+
+        Raises:
+            RuntimeError: If the zone is not attached to a parent status
+            ValueError: If no API reference or serial number is available
+
+        """
+        parent = self.parent_status
+        if not parent.api or not parent.serial_number:
+            raise ValueError("No API reference available to send command")
+        return parent.api, parent.serial_number
+
     async def set_temperature(self, temperature: float) -> None:
         """Set temperature for this zone based on the current AC mode and send the command.
 
@@ -368,32 +401,20 @@ class ActronAirZone(BaseModel):
         temperature = max(self.min_temp, min(self.max_temp, temperature))
 
         command = self._set_temperature_command(temperature)
-        if self.parent_status.api and self.parent_status.serial_number:
-            # Capture optimistic values before await to avoid races
-            settings = self.parent_status.user_aircon_settings
-            mode = settings.mode.upper()
-            optimistic_cool: float | None = None
-            optimistic_heat: float | None = None
-            if mode == AC_MODE_COOL:
-                optimistic_cool = temperature
-            elif mode == AC_MODE_HEAT:
-                optimistic_heat = temperature
-            elif mode == AC_MODE_AUTO:
-                cool = settings.temperature_setpoint_cool_c
-                heat = settings.temperature_setpoint_heat_c
-                differential = cool - heat
-                optimistic_cool = temperature
-                optimistic_heat = max(TEMP_AUTO_HEAT_MIN, temperature - differential)
-
-            await self.parent_status.api.send_command(self.parent_status.serial_number, command)
-
-            # Optimistic local state update using values captured before await
-            if optimistic_cool is not None:
-                self.temperature_setpoint_cool_c = optimistic_cool
-            if optimistic_heat is not None:
-                self.temperature_setpoint_heat_c = optimistic_heat
-        else:
-            raise ValueError("No API reference available to send command")
+        api, serial_number = self._command_target()
+        # Capture optimistic values before await to avoid races
+        cool_key, heat_key = _zone_setpoint_keys(self.zone_id)
+        inner = command["command"]
+        optimistic_cool: float | None = inner.get(cool_key)
+        optimistic_heat: float | None = inner.get(heat_key)
+
+        await api.send_command(serial_number, command)
+
+        # Optimistic local state update using values captured before await
+        if optimistic_cool is not None:
+            self.temperature_setpoint_cool_c = optimistic_cool
+        if optimistic_heat is not None:
+            self.temperature_setpoint_heat_c = optimistic_heat
 
     async def enable(self, is_enabled: bool = True) -> None:
         """Enable or disable this zone and send the command.
@@ -407,12 +428,10 @@ class ActronAirZone(BaseModel):
 
         """
         command = self._set_enable_command(is_enabled)
-        if self.parent_status.api and self.parent_status.serial_number:
-            await self.parent_status.api.send_command(self.parent_status.serial_number, command)
+        api, serial_number = self._command_target()
+        await api.send_command(serial_number, command)
 
-            # Optimistic local state update — apply the exact EnabledZones sent
-            sent_zones = command.get("command", {}).get("UserAirconSettings.EnabledZones")
-            if isinstance(sent_zones, list):
-                self.parent_status.user_aircon_settings.enabled_zones = list(sent_zones)
-        else:
-            raise ValueError("No API reference available to send command")
+        # Optimistic local state update — apply the exact EnabledZones sent
+        sent_zones = command.get("command", {}).get("UserAirconSettings.EnabledZones")
+        if isinstance(sent_zones, list):
+            self.parent_status.user_aircon_settings.enabled_zones = list(sent_zones)
@@ -3,19 +3,29 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
+import random
 import time
-from typing import AsyncIterator, Final
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final, NoReturn
+from urllib.parse import urlencode
 
 import aiohttp
+from pydantic import ValidationError
 
+from . import _json
+from ._http import read_error_text
 from .const import (
     HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_SOCK_READ_TIMEOUT,
     HTTP_TOTAL_TIMEOUT,
-    MAX_ERROR_RESPONSE_LENGTH,
     OAUTH_CLIENT_ID,
-    OAUTH_DEFAULT_EXPIRY,
+    OAUTH_POLL_JITTER,
+    OAUTH_POLL_REQUEST_TIMEOUT,
+    OAUTH_SLOW_DOWN_INCREMENT,
     OAUTH_TOKEN_REFRESH_MARGIN,
 )
 from .exceptions import ActronAirAuthError
@@ -23,6 +33,9 @@ from .models import ActronAirDeviceCode, ActronAirToken, ActronAirUserInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared header for form-encoded token endpoint requests; never mutated
+_FORM_HEADERS: Final[dict[str, str]] = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class ActronAirOAuth2DeviceCodeAuth:
     """OAuth2 Device Code Flow authentication handler for Actron Air API.
@@ -54,22 +67,38 @@ class ActronAirOAuth2DeviceCodeAuth:
         if not client_id or not client_id.strip():
             raise ValueError("client_id cannot be empty")
 
-        base_url = base_url.strip().rstrip("/")
-        self.base_url: str = base_url
         self.client_id: Final[str] = client_id
         self.access_token: str | None = None
         self.refresh_token: str | None = None
         self.token_type: str = "Bearer"
-        self.token_expiry: float | None = None
+        self._token_expiry: float | None = None
+        # Monotonic time after which ensure_token_valid refreshes proactively
+        self._refresh_at: float = float("-inf")
         self.authenticated_platform: str | None = None  # Track which platform issued tokens
         self._session: aiohttp.ClientSession | None = session
+        self._owned_session: aiohttp.ClientSession | None = None
+        self._auth_header_key: tuple[str, str] | None = None
+        self._auth_header: Mapping[str, str] = MappingProxyType({})
         self._token_lock: asyncio.Lock = asyncio.Lock()
 
-        # OAuth2 endpoints
-        self.token_url: str = f"{self.base_url}/api/v0/oauth/token"
-        self.authorize_url: str = f"{self.base_url}/authorize"
-        self.device_auth_url: str = f"{self.base_url}/connect"
-        self.user_info_url: str = f"{self.base_url}/api/v0/client/account"
+        # Base URL and the OAuth2 endpoints derived from it
+        self.base_url: str
+        self.token_url: str
+        self.authorize_url: str
+        self.device_auth_url: str
+        self.user_info_url: str
+        self._set_endpoints(base_url)
+
+    @property
+    def token_expiry(self) -> float | None:
+        """Monotonic deadline at which the access token expires, if known."""
+        return self._token_expiry
+
+    @token_expiry.setter
+    def token_expiry(self, value: float | None) -> None:
+        """Set the expiry deadline and precompute the proactive refresh time."""
+        self._token_expiry = value
+        self._refresh_at = float("-inf") if value is None else value - OAUTH_TOKEN_REFRESH_MARGIN
 
     @property
     def is_token_valid(self) -> bool:
@@ -90,15 +119,36 @@ class ActronAirOAuth2DeviceCodeAuth:
     @property
     def authorization_header(self) -> dict[str, str]:
         """Get the authorization header using the current token."""
+        return dict(self.cached_authorization_header)
+
+    @property
+    def cached_authorization_header(self) -> Mapping[str, str]:
+        """Get the authorization header as a shared, read-only mapping.
+
+        The header is formatted once per token, so requests can send it
+        without rebuilding it. Use :attr:`authorization_header` for a dict
+        that may be modified.
+
+        Raises:
+            ActronAirAuthError: If there is no access token
+
+        """
         if not self.access_token:
             raise ActronAirAuthError("No access token available")
-        return {"Authorization": f"{self.token_type} {self.access_token}"}
+        key = (self.token_type, self.access_token)
+        if key != self._auth_header_key:
+            self._auth_header = MappingProxyType(
+                {"Authorization": f"{self.token_type} {self.access_token}"}
+            )
+            self._auth_header_key = key
+        return self._auth_header
 
     def set_session(self, session: aiohttp.ClientSession | None) -> None:
         """Set or replace the shared HTTP session.
 
         Args:
-            session: aiohttp session to use, or None to revert to per-call sessions
+            session: aiohttp session to use, or None to fall back to a session
+                owned by this handler
 
         """
         self._session = session
@@ -120,30 +170,88 @@ class ActronAirOAuth2DeviceCodeAuth:
         if not base_url or not base_url.strip():
             raise ValueError("base_url cannot be empty")
 
-        base_url = base_url.strip().rstrip("/")
-        self.base_url = base_url
-        self.token_url = f"{self.base_url}/api/v0/oauth/token"
-        self.authorize_url = f"{self.base_url}/authorize"
-        self.device_auth_url = f"{self.base_url}/connect"
-        self.user_info_url = f"{self.base_url}/api/v0/client/account"
+        self._set_endpoints(base_url)
+
+    def _set_endpoints(self, base_url: str) -> None:
+        """Normalise the base URL and derive the OAuth2 endpoint URLs from it.
+
+        Args:
+            base_url: Non-empty base URL for the Actron Air API
+
+        """
+        base = base_url.strip().rstrip("/")
+        self.base_url = base
+        self.token_url = f"{base}/api/v0/oauth/token"
+        self.authorize_url = f"{base}/authorize"
+        self.device_auth_url = f"{base}/connect"
+        self.user_info_url = f"{base}/api/v0/client/account"
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session to use for a request.
 
-    @contextlib.asynccontextmanager
-    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
-        """Get an HTTP session, creating a temporary one if needed.
+        Returns the shared session when one is set. Otherwise a session owned
+        by this handler is created on first use and reused by later calls, so
+        device-code polling and token refreshes keep their connection alive.
+        Call :meth:`close` to release it.
 
-        Yields:
+        Returns:
             An aiohttp.ClientSession to use for requests.
 
         """
-        timeout = aiohttp.ClientTimeout(total=HTTP_TOTAL_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
         if self._session is not None and not self._session.closed:
-            yield self._session
-        else:
-            session = aiohttp.ClientSession(timeout=timeout)
-            try:
-                yield session
-            finally:
-                await session.close()
+            return self._session
+
+        session = self._owned_session
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(
+                    total=HTTP_TOTAL_TIMEOUT,
+                    connect=HTTP_CONNECT_TIMEOUT,
+                    sock_read=HTTP_SOCK_READ_TIMEOUT,
+                ),
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+            )
+            self._owned_session = session
+        return session
+
+    async def close(self) -> None:
+        """Close the HTTP session owned by this handler, if any.
+
+        A shared session supplied via the constructor or :meth:`set_session`
+        is left open; the caller retains ownership of it.
+        """
+        session, self._owned_session = self._owned_session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self) -> ActronAirOAuth2DeviceCodeAuth:
+        """Support for async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Support for async context manager."""
+        await self.close()
+
+    @staticmethod
+    async def _raise_for_response(action: str, response: aiohttp.ClientResponse) -> NoReturn:
+        """Raise an authentication error describing an unexpected HTTP response.
+
+        Only a bounded prefix of the response body is read, and only on this
+        error path.
+
+        Args:
+            action: Short description of the failed operation
+            response: The unsuccessful HTTP response
+
+        Raises:
+            ActronAirAuthError: Always
+
+        """
+        response_text = await read_error_text(response)
+        raise ActronAirAuthError(f"{action}. Status: {response.status}, Response: {response_text}")
 
     async def request_device_code(self) -> ActronAirDeviceCode:
         """Request a device code for OAuth2 device code flow.
@@ -159,46 +267,29 @@ class ActronAirOAuth2DeviceCodeAuth:
             "client_id": self.client_id,
             "scope": "read write",  # Add appropriate scopes
         }
-
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        async with self._get_session() as session:
-            try:
-                async with session.post(self.token_url, data=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        # Validate required fields
-                        required_fields: Final[list[str]] = [
-                            "device_code",
-                            "user_code",
-                            "verification_uri",
-                            "expires_in",
-                            "interval",
+        body = urlencode(payload).encode("ascii")
+
+        session = self._get_session()
+        try:
+            async with session.post(self.token_url, data=body, headers=_FORM_HEADERS) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json.loads)
+                    try:
+                        return ActronAirDeviceCode.model_validate(data)
+                    except ValidationError as e:
+                        missing_fields = [
+                            str(error["loc"][0])
+                            for error in e.errors()
+                            if error["type"] == "missing" and error["loc"]
                         ]
-
-                        missing_fields = [field for field in required_fields if field not in data]
                         if missing_fields:
                             raise ActronAirAuthError(
                                 f"Missing required fields in response: {', '.join(missing_fields)}"
-                            )
-
-                        # Add verification_uri_complete if not present
-                        if "verification_uri_complete" not in data:
-                            data["verification_uri_complete"] = (
-                                f"{data['verification_uri']}?user_code={data['user_code']}"
-                            )
-
-                        return ActronAirDeviceCode(**data)
-                    else:
-                        response_text = await response.text()
-                        raise ActronAirAuthError(
-                            f"Failed to request device code. "
-                            f"Status: {response.status}, "
-                            f"Response: {response_text[:MAX_ERROR_RESPONSE_LENGTH]}"
-                        )
-            except aiohttp.ClientError as e:
-                raise ActronAirAuthError(f"Device code request failed: {e}") from e
+                            ) from e
+                        raise ActronAirAuthError(f"Invalid device code response: {e}") from e
+                await self._raise_for_response("Failed to request device code", response)
+        except aiohttp.ClientError as e:
+            raise ActronAirAuthError(f"Device code request failed: {e}") from e
 
     async def poll_for_token(
         self, device_code: str, interval: int = 5, timeout: int = 600
@@ -234,82 +325,99 @@ class ActronAirOAuth2DeviceCodeAuth:
             "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
             "device_code": device_code,
         }
+        body = urlencode(payload).encode("ascii")
 
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        start_time = time.monotonic()
+        deadline = time.monotonic() + timeout
         current_interval = interval
 
-        async with self._get_session() as session:
-            while time.monotonic() - start_time < timeout:
-                try:
-                    async with session.post(
-                        self.token_url, data=payload, headers=headers
-                    ) as response:
-                        data = await response.json()
-
-                        if response.status == 200 and "access_token" in data:
-                            # Success - store tokens under lock
-                            async with self._token_lock:
-                                self.access_token = data["access_token"]
-                                self.refresh_token = data.get("refresh_token")
-                                self.token_type = data.get("token_type", "Bearer")
-                                self.authenticated_platform = self.base_url
-
-                                raw_expires_in = data.get("expires_in", OAUTH_DEFAULT_EXPIRY)
-                                try:
-                                    expires_in = int(raw_expires_in)
-                                except (TypeError, ValueError):
-                                    expires_in = OAUTH_DEFAULT_EXPIRY
-                                self.token_expiry = time.monotonic() + expires_in
-
-                            return ActronAirToken(**data)
-
-                        elif response.status == 400:
-                            error = data.get("error", "unknown_error")
-
-                            if error == "authorization_pending":
-                                # Still waiting for user authorization - continue polling
-                                await asyncio.sleep(current_interval)
-                                continue
-
-                            elif error == "slow_down":
-                                # Server requests slower polling - increase interval
-                                current_interval += 5  # Add 5 seconds as per OAuth2 spec
-                                await asyncio.sleep(current_interval)
-                                continue
-
-                            elif error == "expired_token":
-                                raise ActronAirAuthError("Device code has expired")
-                            elif error == "access_denied":
-                                raise ActronAirAuthError("User denied authorization")
-                            else:
-                                raise ActronAirAuthError(f"Authorization error: {error}")
+        session = self._get_session()
+        while (now := time.monotonic()) < deadline:
+            # Bound each request so a stalled connection cannot consume the
+            # whole polling budget
+            request_timeout = aiohttp.ClientTimeout(
+                total=min(OAUTH_POLL_REQUEST_TIMEOUT, deadline - now)
+            )
+            try:
+                async with session.post(
+                    self.token_url, data=body, headers=_FORM_HEADERS, timeout=request_timeout
+                ) as response:
+                    data = await response.json(loads=_json.loads)
+
+                    if response.status == 200 and "access_token" in data:
+                        token = ActronAirToken.model_validate(data)
+                        # Success - store tokens under lock
+                        async with self._token_lock:
+                            self.access_token = token.access_token
+                            self.refresh_token = token.refresh_token
+                            self.token_type = token.token_type
+                            self.authenticated_platform = self.base_url
+                            self.token_expiry = time.monotonic() + token.expires_in
+
+                        return token
+
+                    elif response.status == 400:
+                        error = data.get("error", "unknown_error")
+
+                        if error == "authorization_pending":
+                            # Still waiting for user authorization - continue polling
+                            await self._poll_wait(current_interval, deadline - time.monotonic())
+                            continue
+
+                        elif error == "slow_down":
+                            # Server requests slower polling - increase interval
+                            current_interval += OAUTH_SLOW_DOWN_INCREMENT
+                            await self._poll_wait(current_interval, deadline - time.monotonic())
+                            continue
+
+                        elif error == "expired_token":
+                            raise ActronAirAuthError("Device code has expired")
+                        elif error == "access_denied":
+                            raise ActronAirAuthError("User denied authorization")
                         else:
-                            response_text = await response.text()
-                            raise ActronAirAuthError(
-                                f"Token polling failed. "
-                                f"Status: {response.status}, "
-                                f"Response: {response_text[:MAX_ERROR_RESPONSE_LENGTH]}."
-                            )
-
-                except aiohttp.ClientError as poll_err:
-                    _LOGGER.debug("Poll request failed: %s", poll_err)
-                    await asyncio.sleep(current_interval)
-                    continue
-                except (ValueError, KeyError, TypeError) as e:
-                    raise ActronAirAuthError(f"Polling failed: {str(e)}") from e
+                            raise ActronAirAuthError(f"Authorization error: {error}")
+                    await self._raise_for_response("Token polling failed", response)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as poll_err:
+                _LOGGER.debug("Poll request failed: %r", poll_err)
+                await self._poll_wait(current_interval, deadline - time.monotonic())
+                continue
+            except (ValueError, KeyError, TypeError) as e:
+                raise ActronAirAuthError(f"Polling failed: {str(e)}") from e
 
         # Timeout reached
         return None
 
-    async def refresh_access_token(self) -> tuple[str, float]:
+    @staticmethod
+    async def _poll_wait(interval: float, remaining: float) -> None:
+        """Wait one polling interval plus jitter, without overrunning the deadline.
+
+        The interval is never shortened below the server-provided value (as
+        required by RFC 8628); jitter only ever adds delay, spreading out
+        clients that started polling at the same moment.
+
+        Args:
+            interval: Current polling interval in seconds
+            remaining: Seconds left before the polling deadline
+
+        """
+        delay = interval + random.uniform(0, OAUTH_POLL_JITTER)
+        await asyncio.sleep(max(0.0, min(delay, remaining)))
+
+    async def refresh_access_token(self, stale_token: str | None = None) -> tuple[str, float]:
         """Refresh the access token using the refresh token.
 
         Acquires ``_token_lock`` to serialise concurrent refresh attempts.
         Internal callers that already hold the lock should use
         :meth:`_refresh_access_token_unlocked` instead.
 
+        When ``stale_token`` is given (typically the token that was just
+        rejected with a 401), the refresh is skipped if another coroutine has
+        already replaced that token while this one waited for the lock. This
+        ensures a burst of concurrent 401s triggers only a single refresh.
+
+        Args:
+            stale_token: Access token known to have been rejected, if any
+
         Returns:
             Tuple of (access_token, monotonic_expiry_deadline) where the
             deadline is a :func:`time.monotonic` value. It is only valid
@@ -321,6 +429,14 @@ class ActronAirOAuth2DeviceCodeAuth:
 
         """
         async with self._token_lock:
+            if (
+                stale_token is not None
+                and self.access_token != stale_token
+                and self.is_token_valid
+                and self.access_token is not None
+                and self.token_expiry is not None
+            ):
+                return self.access_token, self.token_expiry
             return await self._refresh_access_token_unlocked()
 
     async def _refresh_access_token_unlocked(self) -> tuple[str, float]:
@@ -348,51 +464,34 @@ class ActronAirOAuth2DeviceCodeAuth:
             "refresh_token": self.refresh_token,
             "client_id": self.client_id,
         }
+        body = urlencode(payload).encode("ascii")
+
+        session = self._get_session()
+        try:
+            async with session.post(self.token_url, data=body, headers=_FORM_HEADERS) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json.loads)
+                    try:
+                        token = ActronAirToken.model_validate(data)
+                    except ValidationError as e:
+                        raise ActronAirAuthError(
+                            "Access token missing or invalid in response"
+                        ) from e
 
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+                    token_expiry = time.monotonic() + token.expires_in
 
-        async with self._get_session() as session:
-            try:
-                async with session.post(self.token_url, data=payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        access_token = data.get("access_token")
-                        if not access_token or not isinstance(access_token, str):
-                            raise ActronAirAuthError("Access token missing or invalid in response")
-
-                        # Update refresh token if provided
-                        refresh_token = data.get("refresh_token")
-                        token_type = data.get("token_type", "Bearer")
-                        token_type = token_type if isinstance(token_type, str) else "Bearer"
-
-                        expires_in_raw = data.get("expires_in", OAUTH_DEFAULT_EXPIRY)
-                        try:
-                            expires_in = (
-                                int(expires_in_raw) if expires_in_raw else OAUTH_DEFAULT_EXPIRY
-                            )
-                        except (ValueError, TypeError):
-                            expires_in = OAUTH_DEFAULT_EXPIRY
-
-                        token_expiry = time.monotonic() + expires_in
-
-                        self.access_token = access_token
-                        if refresh_token and isinstance(refresh_token, str):
-                            self.refresh_token = refresh_token
-                        self.token_type = token_type
-                        self.authenticated_platform = self.base_url
-                        self.token_expiry = token_expiry
-
-                        return access_token, token_expiry
-                    else:
-                        response_text = await response.text()
-                        raise ActronAirAuthError(
-                            f"Failed to refresh access token. "
-                            f"Status: {response.status}, "
-                            f"Response: {response_text[:MAX_ERROR_RESPONSE_LENGTH]}."
-                        )
-            except aiohttp.ClientError as e:
-                raise ActronAirAuthError(f"Token refresh request failed: {e}") from e
+                    self.access_token = token.access_token
+                    # Keep the current refresh token unless a new one is issued
+                    if token.refresh_token:
+                        self.refresh_token = token.refresh_token
+                    self.token_type = token.token_type
+                    self.authenticated_platform = self.base_url
+                    self.token_expiry = token_expiry
+
+                    return token.access_token, token_expiry
+                await self._raise_for_response("Failed to refresh access token", response)
+        except aiohttp.ClientError as e:
+            raise ActronAirAuthError(f"Token refresh request failed: {e}") from e
 
     async def get_user_info(self) -> ActronAirUserInfo:
         """Get user information using the access token.
@@ -407,23 +506,17 @@ class ActronAirOAuth2DeviceCodeAuth:
         # Ensure we have a valid access token
         await self.ensure_token_valid()
 
-        headers = self.authorization_header
+        headers = self.cached_authorization_header
 
-        async with self._get_session() as session:
-            try:
-                async with session.get(self.user_info_url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return ActronAirUserInfo.model_validate(data)
-                    else:
-                        response_text = await response.text()
-                        raise ActronAirAuthError(
-                            f"Failed to get user info. "
-                            f"Status: {response.status}, "
-                            f"Response: {response_text[:MAX_ERROR_RESPONSE_LENGTH]}."
-                        )
-            except aiohttp.ClientError as e:
-                raise ActronAirAuthError(f"User info request failed: {e}") from e
+        session = self._get_session()
+        try:
+            async with session.get(self.user_info_url, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json.loads)
+                    return ActronAirUserInfo.model_validate(data)
+                await self._raise_for_response("Failed to get user info", response)
+        except aiohttp.ClientError as e:
+            raise ActronAirAuthError(f"User info request failed: {e}") from e
 
     async def ensure_token_valid(self) -> str:
         """Ensure the token is valid, refreshing proactively if expiring soon.
@@ -439,10 +532,10 @@ class ActronAirOAuth2DeviceCodeAuth:
             ActronAirAuthError: If token is expired and refresh fails
 
         """
-        if self.is_token_valid and not self.is_token_expiring_soon:
-            # is_token_valid guarantees access_token is not None
-            assert self.access_token is not None
-            return self.access_token
+        # Fast path: a single clock read against the precomputed refresh time
+        access_token = self.access_token
+        if access_token is not None and time.monotonic() < self._refresh_at:
+            return access_token
 
         async with self._token_lock:
             # Double-check after acquiring lock
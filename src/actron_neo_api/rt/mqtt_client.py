@@ -11,7 +11,6 @@ import asyncio
 import contextlib
 import inspect
 import ipaddress
-import json
 import logging
 import ssl
 import uuid
@@ -21,6 +20,7 @@ from typing import Any
 
 from aiomqtt import Client, MqttError
 
+from .. import _json
 from ..models import ActronAirStatus
 from .base import (
     RealtimeConnectionDetails,
@@ -223,7 +223,7 @@ class MQTTRTClient:
         if self._client is None:
             raise RuntimeError("MQTT client is not connected")
 
-        encoded_payload = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        encoded_payload = _json.dumps_bytes(payload)
         await self._client.publish(topic, encoded_payload)
 
     async def subscribe_system(
@@ -373,7 +373,7 @@ class MQTTRTClient:
         """Decode a raw MQTT message and forward it to the event queue."""
         try:
             payload = self._decode_payload(raw_payload)
-        except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as exc:
+        except ValueError as exc:
             _LOGGER.warning("Failed to decode MQTT payload on %s: %s", topic, exc)
             return
 
@@ -403,8 +403,7 @@ class MQTTRTClient:
     @staticmethod
     def _decode_payload(raw_payload: bytes) -> dict[str, Any]:
         """Decode an MQTT payload into a JSON object."""
-        decoded = raw_payload.decode("utf-8")
-        payload = json.loads(decoded)
+        payload = _json.loads(raw_payload)
         if not isinstance(payload, dict):
             raise ValueError("MQTT payload must decode to a JSON object")
         return payload
@@ -14,12 +14,12 @@ and mapping incoming payloads to shared domain models.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any, AsyncIterator, Callable, Optional
 
 import aiohttp
 
+from .. import _json
 from .base import (
     RealtimeClient,
     RealtimeConnectionDetails,
@@ -258,7 +258,7 @@ class SignalRRTClient(RealtimeClient):
                     elif line.strip() == "":
                         if buffer:
                             try:
-                                payload = json.loads(buffer)
+                                payload = _json.loads(buffer)
                             except Exception:
                                 _LOGGER.debug("invalid sse json: %s", buffer)
                             else:
@@ -289,7 +289,7 @@ class SignalRRTClient(RealtimeClient):
         async with session.post(url, headers=headers, timeout=timeout) as resp:
             if resp.status != 200:
                 raise RuntimeError(f"negotiate failed: {resp.status}")
-            data = await resp.json()
+            data = await resp.json(loads=_json.loads)
 
         # If server returned a connect URL, use it directly.
         if isinstance(data, dict) and "url" in data:
@@ -16,6 +16,8 @@ _LOGGER = logging.getLogger(__name__)
 class StateManager:
     """Manages the state of Actron Air systems, handling updates and state merging."""
 
+    __slots__ = ("status", "_observers", "_api")
+
     def __init__(self) -> None:
         """Initialize the state manager.
 
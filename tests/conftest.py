@@ -134,6 +134,7 @@ def mock_oauth() -> MagicMock:
     oauth.is_token_expiring_soon = False
     oauth.authenticated_platform = "https://nimbus.actronair.com.au"
     oauth.authorization_header = {"Authorization": "Bearer test_access_token"}
+    oauth.cached_authorization_header = oauth.authorization_header
     oauth.ensure_token_valid = AsyncMock(return_value="test_access_token")
     oauth.refresh_access_token = AsyncMock(return_value=("test_access_token", 1234567890.0))
     return oauth
@@ -149,6 +150,9 @@ def mock_aiohttp_response() -> Any:
         mock_resp.status = status
         mock_resp.json = AsyncMock(return_value=json_data or {})
         mock_resp.text = AsyncMock(return_value=text)
+        mock_resp.content = MagicMock()
+        mock_resp.content.read = AsyncMock(return_value=text.encode())
+        mock_resp.headers = {}
         return mock_resp
 
     return _create_response
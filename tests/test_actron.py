@@ -5,11 +5,13 @@ import logging
 import time
 from copy import deepcopy
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from actron_neo_api import ActronAirAPI
+from actron_neo_api.actron import _normalize_serial
+from actron_neo_api.const import HTTP_RETRY_ATTEMPTS, HTTP_RETRY_BASE_DELAY
 from actron_neo_api.exceptions import ActronAirAPIError, ActronAirAuthError
 from actron_neo_api.models import (
     ActronAirDeviceCode,
@@ -186,6 +188,84 @@ class TestActronAirAPISessionManagement:
         assert session is not None
         assert api._session is session
 
+    def test_create_resolver_falls_back_without_aiodns(self) -> None:
+        """Test the async resolver is used when available, else aiohttp's default."""
+        with patch(
+            "actron_neo_api.actron.aiohttp.AsyncResolver",
+            side_effect=RuntimeError("Resolver requires aiodns library"),
+        ):
+            assert ActronAirAPI._create_resolver() is None
+
+        resolver = MagicMock()
+        with patch("actron_neo_api.actron.aiohttp.AsyncResolver", return_value=resolver):
+            assert ActronAirAPI._create_resolver() is resolver
+
+    @pytest.mark.asyncio
+    async def test_close_closes_async_resolver(self) -> None:
+        """Test the aiodns resolver created for the session is closed with it."""
+        resolver = MagicMock()
+        resolver.close = AsyncMock()
+        api = ActronAirAPI()
+
+        with patch("actron_neo_api.actron.aiohttp.AsyncResolver", return_value=resolver):
+            with patch("actron_neo_api.actron.aiohttp.TCPConnector") as mock_connector:
+                session = await api._get_session()
+
+        assert mock_connector.call_args.kwargs["resolver"] is resolver
+        await session.close()
+
+        # A session closed elsewhere is replaced, along with its resolver
+        replacement = MagicMock()
+        replacement.close = AsyncMock()
+        with patch("actron_neo_api.actron.aiohttp.AsyncResolver", return_value=replacement):
+            with patch("actron_neo_api.actron.aiohttp.TCPConnector"):
+                await api._get_session()
+        resolver.close.assert_awaited_once()
+
+        await api.close()
+        replacement.close.assert_awaited_once()
+        assert api._resolver is None
+
+    @pytest.mark.asyncio
+    async def test_get_session_fast_path_skips_lock(self) -> None:
+        """Test an existing live session is returned without taking the lock."""
+        api = ActronAirAPI()
+        session = MagicMock()
+        session.closed = False
+        api._session = session
+        api._session_lock = MagicMock()  # Would fail if used with "async with"
+
+        assert await api._get_session() is session
+
+    @pytest.mark.asyncio
+    async def test_get_session_uses_pooled_connector(self) -> None:
+        """Test owned sessions are created with keep-alive and DNS caching."""
+        import aiohttp
+
+        from actron_neo_api.const import (
+            HTTP_CONNECTION_LIMIT,
+            HTTP_CONNECTION_LIMIT_PER_HOST,
+            HTTP_DNS_CACHE_TTL,
+            HTTP_KEEPALIVE_TIMEOUT,
+            HTTP_SOCK_READ_TIMEOUT,
+        )
+
+        api = ActronAirAPI()
+        with patch(
+            "actron_neo_api.actron.aiohttp.TCPConnector", wraps=aiohttp.TCPConnector
+        ) as connector_cls:
+            session = await api._get_session()
+
+        kwargs = connector_cls.call_args.kwargs
+        assert kwargs["limit"] == HTTP_CONNECTION_LIMIT
+        assert kwargs["ttl_dns_cache"] == HTTP_DNS_CACHE_TTL
+        assert kwargs["keepalive_timeout"] == HTTP_KEEPALIVE_TIMEOUT
+        assert kwargs["limit_per_host"] == HTTP_CONNECTION_LIMIT_PER_HOST
+        assert session.timeout.sock_read == HTTP_SOCK_READ_TIMEOUT
+        assert session.connector is not None
+        assert session.connector.limit == HTTP_CONNECTION_LIMIT
+        await api.close()
+
     @pytest.mark.asyncio
     async def test_get_session_reuses_existing(self) -> None:
         """Test session reuse."""
@@ -241,6 +321,27 @@ class TestActronAirAPISystemLinkResolution:
 
         assert link == "api/v0/client/ac-systems/abc123/status"
 
+    def test_systems_assignment_builds_link_index(self, sample_system_neo: dict[str, Any]) -> None:
+        """Test assigning systems indexes links by lowercased serial and rel."""
+        api = ActronAirAPI()
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+
+        assert api._link_index[("abc123", "ac-status")] == "api/v0/client/ac-systems/abc123/status"
+
+        api.systems = []
+        assert api._link_index == {}
+
+    def test_systems_with_malformed_links_are_skipped(self) -> None:
+        """Test links that are not a dict are stored as-is but yield no index entries."""
+        api = ActronAirAPI()
+        api.systems = [
+            ActronAirSystemInfo.model_validate({"serial": "ABC123", "_links": None}),
+            ActronAirSystemInfo.model_validate({"serial": "DEF456", "_links": ["bad"]}),
+        ]
+
+        assert api._link_index == {}
+        assert api._get_system_link("abc123", "ac-status") is None
+
     def test_get_system_link_case_insensitive(self, sample_system_neo: dict[str, Any]) -> None:
         """Test case-insensitive serial number matching."""
         api = ActronAirAPI()
@@ -251,6 +352,14 @@ class TestActronAirAPISystemLinkResolution:
         assert link is not None
         assert "abc123" in link
 
+    def test_normalized_serials_are_shared(self) -> None:
+        """Test serial normalization lowercases once and reuses the result."""
+        first = _normalize_serial("ABC123")
+
+        assert first == "abc123"
+        assert _normalize_serial("ABC123") is first
+        assert _normalize_serial("abc123") is first
+
     def test_get_system_link_not_found(self) -> None:
         """Test link not found returns None."""
         api = ActronAirAPI()
@@ -371,6 +480,37 @@ class TestActronAirAPIGetSystems:
         call_args = mock_session.request.call_args
         assert call_args[1]["params"]["includeNeo"] == "true"
 
+    @pytest.mark.asyncio
+    async def test_get_ac_systems_cached_until_invalidated(
+        self,
+        mock_session: AsyncMock,
+        sample_systems_response_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test repeated calls reuse the cached list until invalidated or expired."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data=sample_systems_response_neo
+        )
+
+        first = await api.get_ac_systems()
+        second = await api.get_ac_systems()
+        assert second == first
+        assert mock_session.request.call_count == 1
+
+        api.invalidate_systems_cache()
+        await api.get_ac_systems()
+        assert mock_session.request.call_count == 2
+
+        api._systems_cache_ttl = 0
+        await api.get_ac_systems()
+        assert mock_session.request.call_count == 3
+
 
 class TestActronAirAPIGetStatus:
     """Test get_ac_status method."""
@@ -425,6 +565,158 @@ class TestActronAirAPIGetStatus:
 
         assert status is not None
 
+    @pytest.mark.asyncio
+    async def test_get_ac_status_reuses_cached_payload_until_command(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test repeated reads share one request and commands invalidate it."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data=sample_status_full
+        )
+
+        first = await api.get_ac_status("abc123")
+        second = await api.get_ac_status("ABC123")
+
+        assert mock_session.request.call_count == 1
+        assert second is not first
+        assert second.last_known_state is not first.last_known_state
+
+        await api._send_command_direct("abc123", {"command": {"type": "set-settings"}})
+        await api.get_ac_status("abc123")
+
+        # One status fetch, one command, one fresh status fetch
+        assert mock_session.request.call_count == 3
+
+        api.invalidate_status_cache("ABC123")
+        await api.get_ac_status("abc123")
+        assert mock_session.request.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_get_ac_status_copies_cached_payload_once_per_read(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test each read copies the payload once and leaves the cached one untouched."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data=sample_status_full
+        )
+
+        with patch("actron_neo_api.actron.deepcopy", wraps=deepcopy) as mock_deepcopy:
+            await api.get_ac_status("abc123")
+            assert mock_deepcopy.call_count == 1
+            await api.get_ac_status("abc123")
+            assert mock_deepcopy.call_count == 2
+
+        assert api._status_cache["abc123"][1] == sample_status_full
+        assert "serial_number" not in api._status_cache["abc123"][1]
+
+    @pytest.mark.asyncio
+    async def test_get_ac_status_does_not_cache_payload_fetched_across_command(
+        self,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+    ) -> None:
+        """Test a status read that overlaps a command does not cache its result."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+
+        release = asyncio.Event()
+        requests: list[str] = []
+
+        async def fake_request(method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+            requests.append(method)
+            if method == "get":
+                await release.wait()
+                return deepcopy(sample_status_full)
+            return {}
+
+        with patch.object(api, "_make_request", side_effect=fake_request):
+            slow_read = asyncio.create_task(api.get_ac_status("abc123"))
+            await asyncio.sleep(0)
+            await api._send_command_direct("abc123", {"command": {"type": "set-settings"}})
+            release.set()
+            await slow_read
+
+            assert "abc123" not in api._status_cache
+            await api.get_ac_status("abc123")
+
+        assert requests == ["get", "post", "get"]
+        assert "abc123" in api._status_cache
+
+    @pytest.mark.asyncio
+    async def test_get_ac_status_revalidates_expired_payload(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test an expired payload is revalidated and reused on 304."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+        api._status_cache_ttl = 0.0
+
+        full = mock_aiohttp_response(status=200, json_data=sample_status_full)
+        full.headers = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        mock_session.request.return_value.__aenter__.side_effect = [
+            full,
+            mock_aiohttp_response(status=304),
+        ]
+
+        first = await api.get_ac_status("abc123")
+        second = await api.get_ac_status("abc123")
+
+        assert second.ac_system.master_serial == first.ac_system.master_serial
+        assert second.last_known_state is not first.last_known_state
+        first_headers = mock_session.request.call_args_list[0].kwargs["headers"]
+        second_headers = mock_session.request.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+        assert second_headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_make_request_304_without_validators_raises(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test a 304 to an unconditional request is treated as an error."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=304
+        )
+
+        with pytest.raises(ActronAirAPIError, match="Status: 304"):
+            await api._make_request("get", "test/endpoint")
+
     @pytest.mark.asyncio
     async def test_get_ac_status_missing_link_raises(self) -> None:
         """Test error when status link is missing."""
@@ -435,6 +727,36 @@ class TestActronAirAPIGetStatus:
         with pytest.raises(ActronAirAPIError, match="No ac-status link found"):
             await api.get_ac_status("abc123")
 
+    @pytest.mark.asyncio
+    async def test_get_ac_statuses_partial_failure(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test batched status retrieval maps per-system failures to None."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [
+            ActronAirSystemInfo(**sample_system_neo),
+            ActronAirSystemInfo(serial="def456", links={}),
+        ]
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data=sample_status_full
+        )
+
+        statuses = await api.get_ac_statuses(["ABC123", "def456"])
+
+        assert list(statuses) == ["abc123", "def456"]
+        assert statuses["abc123"] is not None
+        assert statuses["abc123"].is_online is True
+        assert statuses["def456"] is None
+
 
 class TestActronAirAPISendCommand:
     """Test send_command method."""
@@ -465,6 +787,37 @@ class TestActronAirAPISendCommand:
         # Verify the command was sent (response is None for successful commands)
         mock_session.request.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_commands_to_one_system_are_serialised(
+        self, sample_system_neo: dict[str, Any]
+    ) -> None:
+        """Test concurrent direct commands for a system never overlap."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+        in_flight = 0
+        peak = 0
+        sent: list[Any] = []
+
+        async def _post(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            sent.append(kwargs["data"])
+            in_flight -= 1
+            return {}
+
+        api._make_request = _post  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            *(api._send_command_direct("abc123", {"command": {"n": n}}) for n in range(3))
+        )
+
+        assert peak == 1
+        assert sent == [f'{{"command":{{"n":{n}}}}}'.encode() for n in range(3)]
+        # Locks are dropped once no command holds or awaits them
+        assert "abc123" not in api._command_locks
+
     @pytest.mark.asyncio
     async def test_send_command_normalizes_serial(
         self,
@@ -543,8 +896,9 @@ class TestActronAirAPIErrorHandling:
         api.oauth2_auth.refresh_access_token = AsyncMock()
 
         # First call returns 401, second call succeeds
+        first_response = mock_aiohttp_response(status=401, text="Unauthorized")
         mock_session.request.return_value.__aenter__.side_effect = [
-            mock_aiohttp_response(status=401, text="Unauthorized"),
+            first_response,
             mock_aiohttp_response(status=200, json_data={"success": True}),
         ]
 
@@ -552,6 +906,36 @@ class TestActronAirAPIErrorHandling:
 
         assert result["success"] is True
         api.oauth2_auth.refresh_access_token.assert_called_once()
+        # A successful refresh never needs the rejected response's body
+        first_response.content.read.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_make_request_401_retry_sends_refreshed_token(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test the retried request carries the token obtained by the refresh."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        async def _refresh(stale_token: str | None = None) -> None:
+            mock_oauth.access_token = "new_token"
+            mock_oauth.cached_authorization_header = {"Authorization": "Bearer new_token"}
+
+        mock_oauth.refresh_access_token = AsyncMock(side_effect=_refresh)
+        mock_session.request.return_value.__aenter__.side_effect = [
+            mock_aiohttp_response(status=401, text="Unauthorized"),
+            mock_aiohttp_response(status=401, text="Still unauthorized"),
+        ]
+
+        with pytest.raises(ActronAirAuthError, match="Still unauthorized"):
+            await api._make_request("get", "test/endpoint")
+
+        # Refreshed once, then the second rejection is final
+        mock_oauth.refresh_access_token.assert_awaited_once_with("test_access_token")
+        sent = [c.kwargs["headers"]["Authorization"] for c in mock_session.request.call_args_list]
+        assert sent == ["Bearer test_access_token", "Bearer new_token"]
 
     @pytest.mark.asyncio
     async def test_make_request_401_without_refresh_token_raises(
@@ -606,8 +990,169 @@ class TestActronAirAPIErrorHandling:
             status=500, text="Internal Server Error"
         )
 
-        with pytest.raises(ActronAirAPIError, match="API request failed"):
-            await api._make_request("get", "test/endpoint")
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(ActronAirAPIError, match="API request failed"):
+                await api._make_request("get", "test/endpoint")
+
+        assert mock_session.request.call_count == HTTP_RETRY_ATTEMPTS
+        assert mock_sleep.await_count == HTTP_RETRY_ATTEMPTS - 1
+
+    @pytest.mark.asyncio
+    async def test_make_request_retries_transient_status(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test a transient 503 is retried, honouring Retry-After."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        unavailable = mock_aiohttp_response(status=503)
+        unavailable.headers = {"Retry-After": "3"}
+        mock_session.request.return_value.__aenter__.side_effect = [
+            unavailable,
+            mock_aiohttp_response(status=200, json_data={"ok": True}),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await api._make_request("get", "test/endpoint")
+
+        assert result == {"ok": True}
+        mock_sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("status", "retried"), [(408, True), (429, True), (404, False)])
+    async def test_make_request_retries_only_transient_client_errors(
+        self,
+        mock_session: AsyncMock,
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+        status: int,
+        retried: bool,
+    ) -> None:
+        """Test 408 and 429 are retried while other 4xx responses fail at once."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.side_effect = [
+            mock_aiohttp_response(status=status),
+            mock_aiohttp_response(status=200, json_data={"ok": True}),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            if retried:
+                assert await api._make_request("get", "test/endpoint") == {"ok": True}
+            else:
+                with pytest.raises(ActronAirAPIError, match=f"Status: {status}"):
+                    await api._make_request("get", "test/endpoint")
+
+        assert mock_session.request.call_count == (2 if retried else 1)
+
+    @pytest.mark.asyncio
+    async def test_make_request_retries_connection_error(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test connection errors are retried with jittered backoff."""
+        import aiohttp
+
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.side_effect = [
+            aiohttp.ClientConnectionError("reset"),
+            mock_aiohttp_response(status=200, json_data={"ok": True}),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await api._make_request("get", "test/endpoint")
+
+        assert result == {"ok": True}
+        delay = mock_sleep.await_args.args[0]
+        assert 0 <= delay <= HTTP_RETRY_BASE_DELAY
+
+    @pytest.mark.asyncio
+    async def test_make_request_timeout_raises_api_error(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test a timeout on the last attempt is wrapped in ActronAirAPIError."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.side_effect = asyncio.TimeoutError
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(ActronAirAPIError, match="timed out") as exc_info:
+                await api._make_request("get", "test/endpoint")
+
+        assert isinstance(exc_info.value.__cause__, asyncio.TimeoutError)
+        assert mock_session.request.call_count == HTTP_RETRY_ATTEMPTS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,retried", [(503, False), (500, False), (429, True)])
+    async def test_make_request_post_retries_only_unprocessed_statuses(
+        self,
+        mock_session: AsyncMock,
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+        status: int,
+        retried: bool,
+    ) -> None:
+        """Test commands are not resent after a server error the API may have acted on."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.side_effect = [
+            mock_aiohttp_response(status=status, text="busy"),
+            mock_aiohttp_response(status=200, json_data={}),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            if retried:
+                await api._make_request("post", "test/endpoint", data=b"{}")
+            else:
+                with pytest.raises(ActronAirAPIError, match=str(status)):
+                    await api._make_request("post", "test/endpoint", data=b"{}")
+
+        assert mock_session.request.call_count == (2 if retried else 1)
+
+    @pytest.mark.asyncio
+    async def test_make_request_post_timeout_not_retried(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test a command that timed out is not resent, but a failed connect is."""
+        import aiohttp
+
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        connect_error = aiohttp.ClientConnectorError(MagicMock(), OSError("refused"))
+        mock_session.request.return_value.__aenter__.side_effect = [
+            connect_error,
+            asyncio.TimeoutError(),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(ActronAirAPIError, match="timed out"):
+                await api._make_request("post", "test/endpoint", data=b"{}")
+
+        assert mock_session.request.call_count == 2
+
+    def test_parse_retry_after(self) -> None:
+        """Test Retry-After parsing for seconds, HTTP-date and invalid values."""
+        assert ActronAirAPI._parse_retry_after("7") == 7.0
+        assert ActronAirAPI._parse_retry_after(None) is None
+        assert ActronAirAPI._parse_retry_after("soon") is None
+        assert ActronAirAPI._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
 
     @pytest.mark.asyncio
     async def test_make_request_network_error_raises(
@@ -626,6 +1171,370 @@ class TestActronAirAPIErrorHandling:
         with pytest.raises(ActronAirAPIError, match="Request failed"):
             await api._make_request("get", "test/endpoint")
 
+    @pytest.mark.asyncio
+    async def test_make_request_collapses_concurrent_gets(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test identical concurrent GETs share one request but not one result object."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data={"nested": {"value": 1}}
+        )
+
+        first, second = await asyncio.gather(
+            api._make_request("get", "test/endpoint"),
+            api._make_request("get", "test/endpoint"),
+        )
+
+        assert mock_session.request.call_count == 1
+        assert first == second == {"nested": {"value": 1}}
+        assert first is not second
+        assert api._inflight_gets == {}
+
+        await api._make_request("get", "test/endpoint")
+        assert mock_session.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_make_request_does_not_share_conditional_gets(self) -> None:
+        """Test a plain GET does not join a conditional GET for the same endpoint."""
+        api = ActronAirAPI(refresh_token="test_token")
+        release = asyncio.Event()
+        sent: list[dict[str, str] | None] = []
+
+        async def fake_send(*args: Any) -> dict[str, Any]:
+            sent.append(args[7])
+            await release.wait()
+            return {"ok": True}
+
+        with patch.object(api, "_send_request", side_effect=fake_send):
+            validators = {"etag": '"v1"'}
+            conditional = asyncio.create_task(
+                api._make_request("get", "test/endpoint", validators=validators)
+            )
+            shared = asyncio.create_task(
+                api._make_request("get", "test/endpoint", validators=validators)
+            )
+            plain = asyncio.create_task(api._make_request("get", "test/endpoint"))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(conditional, shared, plain)
+
+        assert sent == [validators, None]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_status_cache_drops_inflight_status_get(
+        self, sample_system_neo: dict[str, Any]
+    ) -> None:
+        """Test reads after an invalidation do not join a status GET sent before it."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+        endpoint = api._get_system_link("abc123", "ac-status")
+        assert endpoint
+        release = asyncio.Event()
+        calls = 0
+
+        async def fake_send(*args: Any) -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            call = calls
+            await release.wait()
+            return {"call": call}
+
+        with patch.object(api, "_send_request", side_effect=fake_send):
+            before = asyncio.create_task(api._make_request("get", endpoint))
+            await asyncio.sleep(0)
+            api.invalidate_status_cache("ABC123")
+            after = asyncio.create_task(api._make_request("get", endpoint))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(before, after)
+
+        assert results == [{"call": 1}, {"call": 2}]
+        assert api._inflight_gets == {}
+
+    @pytest.mark.asyncio
+    async def test_make_request_error_body_read_is_bounded(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test only a bounded prefix of an error body is read."""
+        from actron_neo_api.const import MAX_ERROR_RESPONSE_LENGTH
+
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        response = mock_aiohttp_response(status=400, text="Bad Request")
+        mock_session.request.return_value.__aenter__.return_value = response
+
+        with pytest.raises(ActronAirAPIError, match="Response: Bad Request"):
+            await api._make_request("get", "test/endpoint")
+
+        response.content.read.assert_awaited_once_with(MAX_ERROR_RESPONSE_LENGTH)
+        response.text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_make_request_reuses_parsed_url(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test request URLs are parsed once per endpoint and reset with the base URL."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        endpoint = "/api/v0/client/ac-systems/status/latest?serial=abc123"
+        await api._make_request("get", endpoint)
+        await api._make_request("get", endpoint)
+
+        first_url = mock_session.request.call_args_list[0].args[1]
+        second_url = mock_session.request.call_args_list[1].args[1]
+        assert first_url is second_url
+        assert str(first_url) == (
+            "https://nimbus.actronair.com.au/api/v0/client/ac-systems/status/latest?serial=abc123"
+        )
+
+        api._set_base_url("https://que.actronair.com.au", "que")
+        await api._make_request("get", endpoint)
+        assert str(mock_session.request.call_args.args[1]).startswith(
+            "https://que.actronair.com.au/"
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_request_skips_token_check_when_valid(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test ensure_token_valid is only awaited when the token needs attention."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        await api._make_request("get", "test/endpoint")
+        mock_oauth.ensure_token_valid.assert_not_awaited()
+
+        mock_oauth.is_token_expiring_soon = True
+        await api._make_request("get", "test/endpoint")
+        mock_oauth.ensure_token_valid.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_make_request_caches_auth_header_per_token(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test the auth header is rebuilt only on token change and caller headers are untouched."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        caller_headers = {"Content-Type": "application/json"}
+        await api._make_request("post", "test/endpoint", headers=caller_headers)
+        await api._make_request("get", "test/endpoint")
+
+        assert caller_headers == {"Content-Type": "application/json"}
+        first_headers = mock_session.request.call_args_list[0].kwargs["headers"]
+        second_headers = mock_session.request.call_args_list[1].kwargs["headers"]
+        assert first_headers["Authorization"] == "Bearer test_access_token"
+        assert first_headers["Content-Type"] == "application/json"
+        assert second_headers is mock_oauth.cached_authorization_header
+
+        mock_oauth.access_token = "rotated_token"
+        mock_oauth.cached_authorization_header = {"Authorization": "Bearer rotated_token"}
+        await api._make_request("get", "test/other")
+        assert mock_session.request.call_args.kwargs["headers"] == {
+            "Authorization": "Bearer rotated_token"
+        }
+
+    @pytest.mark.asyncio
+    async def test_make_request_without_decoding(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test decode_json=False drains the body without parsing it."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        response = mock_aiohttp_response(status=200, json_data={"ack": True})
+        mock_session.request.return_value.__aenter__.return_value = response
+
+        result = await api._make_request("post", "test/endpoint", decode_json=False)
+
+        assert result == {}
+        response.read.assert_awaited_once()
+        response.json.assert_not_awaited()
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker guarding API requests."""
+
+    def test_opens_after_threshold_and_probes_after_timeout(self) -> None:
+        """Test breaker transitions closed -> open -> half-open -> closed."""
+        from actron_neo_api.actron import _CircuitBreaker
+
+        breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        with patch("actron_neo_api.actron.time.monotonic", return_value=100.0):
+            breaker.on_failure()
+            assert breaker.state == "closed"
+            breaker.on_failure()
+            assert breaker.state == "open"
+            with pytest.raises(ActronAirAPIError, match="Circuit open"):
+                breaker.before()
+
+        with patch("actron_neo_api.actron.time.monotonic", return_value=131.0):
+            assert breaker.state == "half_open"
+            breaker.before()  # Probe allowed
+            with pytest.raises(ActronAirAPIError, match="Circuit open"):
+                breaker.before()  # Concurrent callers still fast-fail
+            breaker.on_success()
+            assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test a failed half-open probe re-opens the breaker."""
+        from actron_neo_api.actron import _CircuitBreaker
+
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+        with patch("actron_neo_api.actron.time.monotonic", return_value=0.0):
+            breaker.on_failure()
+        with patch("actron_neo_api.actron.time.monotonic", return_value=31.0):
+            breaker.before()
+            breaker.on_failure()
+            assert breaker.state == "open"
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_request(
+        self, mock_session: AsyncMock, mock_oauth: AsyncMock
+    ) -> None:
+        """Test requests fast-fail without touching the network while open."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        for _ in range(api._breaker.failure_threshold):
+            api._breaker.on_failure()
+
+        with pytest.raises(ActronAirAPIError, match="Circuit open"):
+            await api._make_request("get", "test/endpoint")
+
+        mock_session.request.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [429, 408])
+    async def test_throttling_does_not_open_breaker(
+        self,
+        mock_session: AsyncMock,
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+        status: int,
+    ) -> None:
+        """Test sustained throttling responses leave the breaker closed."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=status, text="slow down"
+        )
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            for _ in range(api._breaker.failure_threshold + 1):
+                with pytest.raises(ActronAirAPIError, match=str(status)):
+                    await api._make_request("get", "test/endpoint")
+
+        assert api._breaker.state == "closed"
+
+
+class TestRateLimiter:
+    """Test the adaptive rate limiter pacing API requests."""
+
+    @pytest.mark.asyncio
+    async def test_waits_once_burst_is_spent(self) -> None:
+        """Test requests beyond the burst wait for their refill slot."""
+        from actron_neo_api.actron import _RateLimiter
+
+        with patch("actron_neo_api.actron.time.monotonic", return_value=0.0):
+            limiter = _RateLimiter(rate=2.0, min_rate=0.5, max_rate=4.0, burst=2.0)
+            with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as sleep:
+                await limiter.acquire()
+                await limiter.acquire()
+                sleep.assert_not_awaited()
+
+                await limiter.acquire()
+                await limiter.acquire()
+
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+    def test_additive_increase_multiplicative_decrease(self) -> None:
+        """Test the rate grows on success and halves on overload, within bounds."""
+        from actron_neo_api.actron import _RateLimiter
+
+        limiter = _RateLimiter(rate=2.0, min_rate=0.5, max_rate=3.0, burst=8.0)
+
+        limiter.on_success()
+        assert limiter.rate == 2.5
+        limiter.on_success()
+        limiter.on_success()
+        assert limiter.rate == 3.0
+
+        limiter.on_throttle()
+        assert limiter.rate == 1.5
+        assert limiter._tokens <= limiter.rate
+        for _ in range(5):
+            limiter.on_throttle()
+        assert limiter.rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_pauses_when_reported_quota_is_low(self) -> None:
+        """Test a nearly spent X-RateLimit quota holds requests until reset."""
+        from actron_neo_api.actron import _RateLimiter
+
+        with patch("actron_neo_api.actron.time.monotonic", return_value=0.0):
+            limiter = _RateLimiter(rate=8.0, min_rate=0.5, max_rate=16.0, burst=8.0)
+            limiter.observe(
+                {
+                    "X-RateLimit-Remaining": "50",
+                    "X-RateLimit-Limit": "100",
+                    "X-RateLimit-Reset": "9",
+                }
+            )
+            limiter.observe({"X-RateLimit-Remaining": "bogus", "X-RateLimit-Reset": "9"})
+            with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as sleep:
+                await limiter.acquire()
+            sleep.assert_not_awaited()
+
+            limiter.observe(
+                {"X-RateLimit-Remaining": "5", "X-RateLimit-Limit": "100", "X-RateLimit-Reset": "9"}
+            )
+            with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock) as sleep:
+                await limiter.acquire()
+            sleep.assert_awaited_once_with(9.0)
+
+    @pytest.mark.asyncio
+    async def test_overload_response_slows_requests(
+        self, mock_session: AsyncMock, mock_aiohttp_response: Any, mock_oauth: AsyncMock
+    ) -> None:
+        """Test a 429 response lowers the request rate."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        initial_rate = api._limiter.rate
+
+        mock_session.request.return_value.__aenter__.side_effect = [
+            mock_aiohttp_response(status=429),
+            mock_aiohttp_response(status=200, json_data={"ok": True}),
+        ]
+
+        with patch("actron_neo_api.actron.asyncio.sleep", new_callable=AsyncMock):
+            await api._make_request("get", "test/endpoint")
+
+        assert api._limiter.rate < initial_rate
+
 
 class TestActronAirAPITokenProperties:
     """Test token property accessors."""
@@ -701,6 +1610,47 @@ class TestActronAirAPIUpdateStatus:
         assert len(result) == 1
         assert "abc123" in result
 
+    @pytest.mark.asyncio
+    async def test_update_status_all_systems_raises_after_partial_failure(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """Test a failing system raises once the others have been updated."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [
+            ActronAirSystemInfo(serial="def456", links={}),
+            ActronAirSystemInfo(**sample_system_neo),
+        ]
+
+        mock_session.request.return_value.__aenter__.return_value = mock_aiohttp_response(
+            status=200, json_data=sample_status_full
+        )
+
+        with pytest.raises(ActronAirAPIError, match="No ac-status link found for system def456"):
+            await api.update_status()
+
+        assert api.state_manager.get_status("abc123") is not None
+        assert api.state_manager.get_status("def456") is None
+
+    @pytest.mark.asyncio
+    async def test_update_status_all_systems_reraises_auth_error(self) -> None:
+        """Test authentication failures still propagate from a batch update."""
+        api = ActronAirAPI(refresh_token="test_token")
+        api.systems = [ActronAirSystemInfo(serial="abc123", links={})]
+        api.get_ac_status = AsyncMock(  # type: ignore[method-assign]
+            side_effect=ActronAirAuthError("Token revoked")
+        )
+
+        with pytest.raises(ActronAirAuthError, match="Token revoked"):
+            await api.update_status()
+
     @pytest.mark.asyncio
     async def test_update_status_empty_systems(self) -> None:
         """Test update_status with no systems returns empty dict."""
@@ -852,6 +1802,24 @@ class TestActronAirAPIInjectableSession:
         assert api._external_session is False
         assert api.oauth2_auth._session is None
 
+    @pytest.mark.asyncio
+    async def test_injected_timeout_and_connector(self) -> None:
+        """Test a caller-supplied timeout and connector are used but not closed."""
+        import aiohttp
+
+        timeout = aiohttp.ClientTimeout(total=5)
+        connector = aiohttp.TCPConnector(limit=2)
+        api = ActronAirAPI(timeout=timeout, connector=connector)
+
+        session = await api._get_session()
+        assert session.timeout is timeout
+        assert session.connector is connector
+
+        await api.close()
+        assert session.closed
+        assert not connector.closed
+        await connector.close()
+
     @pytest.mark.asyncio
     async def test_close_does_not_close_external_session(self) -> None:
         """Test close() does NOT close an externally-provided session."""
@@ -1268,6 +2236,47 @@ class TestActronAirAPIRealtimeIntegration:
         assert status.user_aircon_settings.quiet_mode_enabled is True
         assert status.user_aircon_settings.turbo_enabled is True
 
+    @pytest.mark.asyncio
+    async def test_metadata_only_mqtt_signal_bypasses_status_cache(
+        self,
+        mock_session: AsyncMock,
+        sample_status_full: dict[str, Any],
+        sample_system_neo: dict[str, Any],
+        mock_aiohttp_response: Any,
+        mock_oauth: AsyncMock,
+    ) -> None:
+        """A status-change signal inside the cache TTL should still fetch fresh status."""
+        api = ActronAirAPI(platform="neo")
+        api._initialized = True
+        api._session = mock_session
+        api.oauth2_auth = mock_oauth
+        api.systems = [ActronAirSystemInfo(**sample_system_neo)]
+        api._push_running = True
+
+        refreshed_payload = deepcopy(sample_status_full)
+        refreshed_payload["lastKnownState"]["UserAirconSettings"]["QuietModeEnabled"] = True
+        mock_session.request.return_value.__aenter__.side_effect = [
+            mock_aiohttp_response(status=200, json_data=sample_status_full),
+            mock_aiohttp_response(status=200, json_data=refreshed_payload),
+        ]
+
+        await api.update_status("abc123")
+
+        event = RealtimeMessage(
+            transport=RealtimeTransportType.MQTT,
+            kind=RealtimeEventKind.MESSAGE,
+            topic="actron-cloud/u/neo/abc123/mwc/status-change",
+            payload={"event": "statusChange", "wcFirmware": "1.2.3"},
+            raw_payload=None,
+            domain_model=None,
+        )
+        await api._handle_realtime_event(event)
+
+        assert mock_session.request.call_count == 2
+        status = api.state_manager.get_status("abc123")
+        assert status is not None
+        assert status.user_aircon_settings.quiet_mode_enabled is True
+
     @pytest.mark.asyncio
     async def test_handle_realtime_event_drops_mqtt_status_change_when_baseline_fails(
         self, caplog: pytest.LogCaptureFixture
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -490,7 +491,7 @@ class TestActronAirAPISendCommandCoalescing:
 
         # Verify merged EnabledZones: zone 0→False, zone 1→True, rest unchanged
         call_kwargs = mock_session.request.call_args
-        sent_json = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        sent_json = json.loads(call_kwargs.kwargs["data"])
         assert sent_json["command"]["UserAirconSettings.EnabledZones"] == [
             False,
             True,
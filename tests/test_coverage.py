@@ -49,7 +49,8 @@ class TestActronAPIAuthErrors:
         mock_session = AsyncMock()
         mock_response = AsyncMock()
         mock_response.status = 401
-        mock_response.text = AsyncMock(return_value="Unauthorized")
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(return_value=b"Unauthorized")
 
         # Mock the refresh to raise TypeError (caught in the 401 block)
         api.oauth2_auth.refresh_access_token = AsyncMock(side_effect=TypeError("Network error"))
@@ -86,7 +86,8 @@ class TestMakeRequest401RetryPaths:
         """Create a mock session that returns a 401 response."""
         mock_response = AsyncMock()
         mock_response.status = 401
-        mock_response.text = AsyncMock(return_value="Unauthorized")
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(return_value=b"Unauthorized")
 
         mock_ctx = AsyncMock()
         mock_ctx.__aenter__ = AsyncMock(return_value=mock_response)
@@ -749,6 +750,7 @@ class TestMakeRequest204Response:
 
         mock_response = AsyncMock()
         mock_response.status = 204
+        mock_response.headers = {}
         mock_response.json = AsyncMock()
 
         mock_ctx = AsyncMock()
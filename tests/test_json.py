@@ -0,0 +1,30 @@
+"""Tests for the JSON helper module."""
+
+from actron_neo_api import _json
+
+
+class TestJsonHelpers:
+    """Test JSON encode/decode helpers."""
+
+    def test_round_trip(self) -> None:
+        """Test that encoding then decoding preserves nested structures."""
+        payload = {"command": {"UserAirconSettings.EnabledZones": [True, False], "type": "x"}}
+
+        encoded = _json.dumps(payload)
+
+        assert isinstance(encoded, str)
+        assert " " not in encoded
+        assert _json.loads(encoded) == payload
+
+    def test_loads_accepts_bytes(self) -> None:
+        """Test decoding from raw bytes."""
+        assert _json.loads(b'{"isOnline": true}') == {"isOnline": True}
+
+    def test_dumps_bytes_matches_dumps(self) -> None:
+        """Test the bytes encoder produces the UTF-8 form of the string encoder."""
+        payload = {"command": {"UserAirconSettings.Mode": "COOL", "type": "set-settings"}}
+
+        encoded = _json.dumps_bytes(payload)
+
+        assert isinstance(encoded, bytes)
+        assert encoded == _json.dumps(payload).encode("utf-8")
@@ -55,6 +55,9 @@ class TestActronAirOAuth2DeviceCodeAuth:
             assert result.user_code == "TEST123"
             assert result.verification_uri == "https://example.com/device"
             assert result.verification_uri_complete is not None
+            assert mock_post.call_args.kwargs["headers"] == {
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
 
     @pytest.mark.asyncio
     async def test_poll_for_token_success(self) -> None:
@@ -144,6 +147,17 @@ class TestActronAirOAuth2DeviceCodeAuth:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_poll_wait_adds_jitter_and_respects_deadline(self) -> None:
+        """Poll waits never undercut the interval and never overrun the deadline."""
+        with patch("actron_neo_api.oauth.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await ActronAirOAuth2DeviceCodeAuth._poll_wait(5, remaining=100)
+            delay = mock_sleep.await_args.args[0]
+            assert 5 <= delay <= 5.5
+
+            await ActronAirOAuth2DeviceCodeAuth._poll_wait(5, remaining=2)
+            assert mock_sleep.await_args.args[0] == 2
+
     @pytest.mark.asyncio
     async def test_refresh_access_token(self) -> None:
         """Test access token refresh."""
@@ -186,6 +200,9 @@ class TestActronAirOAuth2DeviceCodeAuth:
             assert result.sub == "test_user_id"
             assert result.email == "test@example.com"
             assert result.name == "Test User"
+            assert mock_get.call_args.kwargs["headers"] == {
+                "Authorization": "Bearer test_access_token"
+            }
 
     def test_set_tokens(self) -> None:
         """Test manually setting tokens."""
@@ -232,6 +249,31 @@ class TestActronAirOAuth2DeviceCodeAuth:
         header = auth.authorization_header
         assert header == {"Authorization": "Bearer test_token"}
 
+    def test_authorization_header_cached_per_token(self) -> None:
+        """Test the cached header is reused until the token changes and is read-only."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+        auth.access_token = "test_token"
+
+        header = auth.cached_authorization_header
+        assert auth.cached_authorization_header is header
+        with pytest.raises(TypeError):
+            header["Authorization"] = "tampered"  # type: ignore[index]
+
+        auth.access_token = "rotated_token"
+        assert auth.cached_authorization_header == {"Authorization": "Bearer rotated_token"}
+        assert auth.cached_authorization_header is not header
+
+    def test_authorization_header_returns_mutable_copy(self) -> None:
+        """Test the public header is a fresh dict callers may modify."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+        auth.access_token = "test_token"
+
+        header = auth.authorization_header
+        assert type(header) is dict
+        header["Content-Type"] = "application/json"
+
+        assert auth.authorization_header == {"Authorization": "Bearer test_token"}
+
     def test_is_token_valid_properties(self) -> None:
         """Test token validity and expiry properties."""
         auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
@@ -287,6 +329,60 @@ class TestActronAirOAuth2DeviceCodeAuth:
             ):
                 await auth.request_device_code()
 
+    def test_token_model_normalises_response_fields(self) -> None:
+        """Test token responses are coerced with the same fallbacks as before."""
+        token = ActronAirToken.model_validate(
+            {"access_token": "tok", "refresh_token": 42, "token_type": None, "expires_in": "7200"}
+        )
+        assert token.refresh_token is None
+        assert token.token_type == "Bearer"
+        assert token.expires_in == 7200
+
+        token = ActronAirToken.model_validate({"access_token": "tok", "expires_in": ""})
+        assert token.expires_in == 3600
+
+    def test_device_code_derives_verification_uri_complete(self) -> None:
+        """Test verification_uri_complete is built when the server omits it."""
+        device_code = ActronAirDeviceCode.model_validate(
+            {
+                "device_code": "test_code",
+                "user_code": "TEST",
+                "verification_uri": "https://example.com/device",
+                "expires_in": 600,
+                "interval": 5,
+            }
+        )
+        assert device_code.verification_uri_complete == "https://example.com/device?user_code=TEST"
+
+    @pytest.mark.asyncio
+    async def test_request_device_code_invalid_field_type(self) -> None:
+        """Test device code request with a field that fails validation."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(
+            return_value={
+                "device_code": "test_code",
+                "user_code": "TEST",
+                "verification_uri": "https://example.com/device",
+                "expires_in": 600,
+                "interval": "soon",
+            }
+        )
+
+        mock_post = AsyncMock()
+        mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
+        mock_post.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=mock_post)
+        mock_session.closed = False
+
+        auth.set_session(mock_session)
+        with pytest.raises(ActronAirAuthError, match="Invalid device code response"):
+            await auth.request_device_code()
+
     @pytest.mark.asyncio
     async def test_request_device_code_http_error(self) -> None:
         """Test device code request with HTTP error."""
@@ -294,7 +390,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
 
         mock_resp = AsyncMock()
         mock_resp.status = 400
-        mock_resp.text = AsyncMock(return_value="Bad Request")
+        mock_resp.content.read = AsyncMock(return_value=b"Bad Request")
 
         mock_post = AsyncMock()
         mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -321,7 +417,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
         ]
         response_index = [0]
 
-        async def mock_json() -> dict[str, str]:
+        async def mock_json(loads: Any = None) -> dict[str, str]:
             result = responses[min(response_index[0], len(responses) - 1)]
             response_index[0] += 1
             return result
@@ -343,7 +439,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
             patch("actron_neo_api.oauth.asyncio.sleep", new=AsyncMock()),
             patch("actron_neo_api.oauth.time") as mock_time_mod,
         ):
-            mock_time_mod.monotonic.side_effect = [0, 0, 1, 7, 11]
+            mock_time_mod.monotonic.side_effect = [0, 0, 1, 1, 7, 7, 9, 11]
             result = await auth.poll_for_token("test_device", interval=1, timeout=10)
             assert result is None  # Timeout
 
@@ -417,7 +513,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
 
         mock_resp = AsyncMock()
         mock_resp.status = 500
-        mock_resp.text = AsyncMock(return_value="Internal Server Error")
+        mock_resp.content.read = AsyncMock(return_value=b"Internal Server Error")
 
         mock_post = AsyncMock()
         mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -460,10 +556,61 @@ class TestActronAirOAuth2DeviceCodeAuth:
             patch("actron_neo_api.oauth.asyncio.sleep", new=AsyncMock()),
             patch("actron_neo_api.oauth.time") as mock_time_mod,
         ):
-            mock_time_mod.monotonic.side_effect = [0, 0, 1, 2, 11]
+            mock_time_mod.monotonic.side_effect = [0, 0, 1, 1, 2, 2, 3, 11]
             result = await auth.poll_for_token("test_device", interval=1, timeout=10)
             assert result is None  # Should timeout
 
+    @pytest.mark.asyncio
+    async def test_poll_for_token_request_timeout_is_bounded_and_retried(self) -> None:
+        """Test each poll request gets a bounded timeout and timeouts keep polling."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(side_effect=asyncio.TimeoutError)
+        mock_session.closed = False
+        auth.set_session(mock_session)
+
+        with (
+            patch("actron_neo_api.oauth.asyncio.sleep", new=AsyncMock()),
+            patch("actron_neo_api.oauth.time") as mock_time_mod,
+        ):
+            mock_time_mod.monotonic.side_effect = [0, 0, 1, 5, 6, 11]
+            result = await auth.poll_for_token("test_device", interval=1, timeout=10)
+
+        assert result is None
+        assert mock_session.post.call_count == 2
+        timeouts = [c.kwargs["timeout"].total for c in mock_session.post.call_args_list]
+        # Capped at the per-request limit, then by the time left before the deadline
+        assert timeouts == [10.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_poll_for_token_wait_accounts_for_slow_response(self) -> None:
+        """Test the wait after a slow poll response stops at the deadline."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+
+        mock_resp = AsyncMock()
+        mock_resp.status = 400
+        mock_resp.json = AsyncMock(return_value={"error": "authorization_pending"})
+        mock_post = AsyncMock()
+        mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
+        mock_post.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=mock_post)
+        mock_session.closed = False
+        auth.set_session(mock_session)
+
+        with (
+            patch("actron_neo_api.oauth.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+            patch("actron_neo_api.oauth.time") as mock_time_mod,
+        ):
+            # The response arrives 9s into a 10s budget
+            mock_time_mod.monotonic.side_effect = [0, 0, 9, 11]
+            result = await auth.poll_for_token("test_device", interval=5, timeout=10)
+
+        assert result is None
+        mock_sleep.assert_awaited_once_with(1)
+
     @pytest.mark.asyncio
     async def test_poll_for_token_json_parsing_error(self) -> None:
         """Test token polling with JSON parsing error."""
@@ -532,7 +679,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
 
         mock_resp = AsyncMock()
         mock_resp.status = 401
-        mock_resp.text = AsyncMock(return_value="Unauthorized")
+        mock_resp.content.read = AsyncMock(return_value=b"Unauthorized")
 
         mock_post = AsyncMock()
         mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -586,7 +733,7 @@ class TestActronAirOAuth2DeviceCodeAuth:
 
         mock_resp = AsyncMock()
         mock_resp.status = 401
-        mock_resp.text = AsyncMock(return_value="Unauthorized")
+        mock_resp.content.read = AsyncMock(return_value=b"Unauthorized")
 
         mock_get = AsyncMock()
         mock_get.__aenter__ = AsyncMock(return_value=mock_resp)
@@ -600,6 +747,23 @@ class TestActronAirOAuth2DeviceCodeAuth:
             with pytest.raises(ActronAirAuthError, match="Failed to get user info"):
                 await auth.get_user_info()
 
+    @pytest.mark.asyncio
+    async def test_ensure_token_valid_fast_path_tracks_expiry(self) -> None:
+        """Test the fast path skips refresh until the refresh margin is reached."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+        auth.set_tokens("fresh_token", "test_refresh", expires_in=3600)
+
+        with patch.object(
+            auth, "_refresh_access_token_unlocked", new_callable=AsyncMock
+        ) as mock_refresh:
+            assert await auth.ensure_token_valid() == "fresh_token"
+            mock_refresh.assert_not_awaited()
+
+            # Moving the expiry inside the refresh margin takes the slow path
+            auth.token_expiry = time.monotonic() + 60
+            await auth.ensure_token_valid()
+            mock_refresh.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_ensure_token_valid_when_expired(self) -> None:
         """Test ensure_token_valid refreshes expired token."""
@@ -831,8 +995,8 @@ class TestActronAirOAuth2InjectableSession:
         mock_session.close.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_no_session_creates_and_closes_temp(self) -> None:
-        """Test that without injected session, a temp session is created and closed."""
+    async def test_no_session_creates_reused_owned_session(self) -> None:
+        """Test that without injected session, one owned session is reused until close."""
         mock_resp = AsyncMock()
         mock_resp.status = 200
         mock_resp.json = AsyncMock(
@@ -849,16 +1013,25 @@ class TestActronAirOAuth2InjectableSession:
 
         mock_session = MagicMock()
         mock_session.post = MagicMock(return_value=mock_post)
+        mock_session.closed = False
         mock_session.close = AsyncMock()
 
         auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
         auth.refresh_token = "test_refresh"
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
-            await auth.refresh_access_token()
+        with (
+            patch("aiohttp.ClientSession", return_value=mock_session) as mock_client_session,
+            patch("aiohttp.TCPConnector"),
+        ):
+            async with auth:
+                await auth.refresh_access_token()
+                await auth.refresh_access_token()
+                mock_session.close.assert_not_called()
 
-        # Temp session SHOULD be closed
-        mock_session.close.assert_called_once()
+        # One session serves both calls and is closed on exit
+        mock_client_session.assert_called_once()
+        assert mock_session.post.call_count == 2
+        mock_session.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_injected_session_used_for_device_code(self) -> None:
@@ -958,6 +1131,37 @@ class TestTokenRefreshLock:
         assert results[0] == "new_token"
         assert results[1] == "new_token"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_of_rejected_token_single_refresh(self) -> None:
+        """Concurrent refreshes of the same rejected token hit the server once."""
+        auth = ActronAirOAuth2DeviceCodeAuth("https://example.com", "test_client")
+        auth.access_token = "rejected_token"
+        auth.refresh_token = "test_refresh"
+        auth.token_expiry = time.monotonic() + 3600  # Locally valid, rejected by server
+
+        call_count = 0
+
+        async def mock_refresh() -> tuple[str, float]:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)  # Simulate network delay
+            auth.access_token = f"new_token_{call_count}"
+            auth.token_expiry = time.monotonic() + 3600
+            return auth.access_token, auth.token_expiry
+
+        auth._refresh_access_token_unlocked = mock_refresh  # type: ignore[assignment]
+
+        results = await asyncio.gather(
+            *(auth.refresh_access_token("rejected_token") for _ in range(3))
+        )
+
+        assert call_count == 1
+        assert {token for token, _ in results} == {"new_token_1"}
+
+        # Without a stale token, an explicit refresh always goes to the server
+        await auth.refresh_access_token()
+        assert call_count == 2
+
     @pytest.mark.asyncio
     async def test_proactive_refresh_when_expiring_soon(self) -> None:
         """Token is refreshed proactively when within 15 minutes of expiry."""
@@ -352,6 +352,73 @@ class TestSettingsAsyncSetTurboMode:
             await settings_without_api.set_turbo_mode(True)
 
 
+class TestSettingsAsyncSetSettings:
+    """Test set_settings batch method."""
+
+    @pytest.mark.asyncio
+    async def test_set_settings_sends_one_merged_command(
+        self, settings_with_api: ActronAirUserAirconSettings, mock_api: Any
+    ) -> None:
+        """Test several settings are sent in one command and applied locally."""
+        await settings_with_api.set_settings(isOn=False, Mode="HEAT", QuietModeEnabled=True)
+
+        assert mock_api.last_serial == "TEST123"
+        assert mock_api.last_command == {
+            "command": {
+                "UserAirconSettings.isOn": False,
+                "UserAirconSettings.Mode": "HEAT",
+                "UserAirconSettings.QuietModeEnabled": True,
+                "type": "set-settings",
+            }
+        }
+
+        # Optimistic local state update
+        assert settings_with_api.is_on is False
+        assert settings_with_api.mode == "HEAT"
+        assert settings_with_api.quiet_mode_enabled is True
+
+    @pytest.mark.asyncio
+    async def test_set_settings_requires_a_setting(
+        self, settings_with_api: ActronAirUserAirconSettings
+    ) -> None:
+        """Test calling set_settings with no settings raises."""
+        with pytest.raises(ValueError, match="At least one setting"):
+            await settings_with_api.set_settings()
+
+    @pytest.mark.asyncio
+    async def test_set_settings_rejects_wrong_type(
+        self, settings_with_api: ActronAirUserAirconSettings, mock_api: Any
+    ) -> None:
+        """Test a value of the wrong type is rejected before anything is sent."""
+        with pytest.raises(ValueError, match="Mode"):
+            await settings_with_api.set_settings(isOn=True, Mode=1)
+
+        assert mock_api.last_command is None
+        assert settings_with_api.mode == "COOL"
+
+    @pytest.mark.asyncio
+    async def test_set_settings_sends_unknown_keys_without_local_update(
+        self, settings_with_api: ActronAirUserAirconSettings, mock_api: Any
+    ) -> None:
+        """Test keys without a matching field are sent but not applied locally."""
+        before = settings_with_api.model_dump()
+
+        await settings_with_api.set_settings(**{"TurboMode.Enabled": True})
+
+        assert mock_api.last_command == {
+            "command": {"UserAirconSettings.TurboMode.Enabled": True, "type": "set-settings"}
+        }
+        assert settings_with_api.model_dump() == before
+
+    @pytest.mark.asyncio
+    async def test_set_settings_without_api(
+        self, settings_without_api: ActronAirUserAirconSettings
+    ) -> None:
+        """Test set_settings without API reference raises."""
+        with pytest.raises(ValueError, match="No API reference available"):
+            await settings_without_api.set_settings(isOn=True)
+
+
 class TestOptimisticStateNotUpdatedOnError:
     """Verify optimistic state is NOT updated when send_command raises."""
 
@@ -62,7 +62,7 @@ class _Response:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
         return False
 
-    async def json(self) -> Any:
+    async def json(self, loads: Any = None) -> Any:
         return self._json_data
 
 
@@ -118,6 +118,16 @@ class TestStatusProperties:
         assert 1 in zones
         assert 2 in zones
 
+    def test_active_zones_matches_zone_is_active(self, full_status_data):
+        """Test active_zones agrees with each zone's is_active and pads short lists."""
+        status = ActronAirStatus.model_validate(full_status_data)
+
+        assert status.active_zones == [zone.is_active for zone in status.remote_zone_info]
+
+        status.user_aircon_settings.enabled_zones = [True]
+        assert status.active_zones == [zone.is_active for zone in status.remote_zone_info]
+        assert status.active_zones[1:] == [False, False]
+
     def test_clean_filter_with_alerts(self, full_status_data):
         """Test clean_filter property when alerts exist."""
         status = ActronAirStatus.model_validate(full_status_data)
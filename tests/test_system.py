@@ -5,7 +5,11 @@ from typing import Any
 import pytest
 
 from actron_neo_api.models import ActronAirStatus
-from actron_neo_api.models.system import ActronAirACSystem, ActronAirOutdoorUnit
+from actron_neo_api.models.system import (
+    ActronAirACSystem,
+    ActronAirOutdoorUnit,
+    ActronAirSystemInfo,
+)
 
 
 @pytest.fixture
@@ -39,6 +43,15 @@ def ac_system_with_api(mock_api: Any) -> ActronAirACSystem:
 class TestACSystemSetMode:
     """Test ACSystem set_mode method."""
 
+    @pytest.mark.asyncio
+    async def test_set_mode_normalises_case_and_whitespace(
+        self, ac_system_with_api: ActronAirACSystem, mock_api: Any
+    ) -> None:
+        """Test a non-canonical mode string is stripped and upper-cased."""
+        await ac_system_with_api.set_system_mode("  heat ")
+
+        assert mock_api.last_command["command"]["UserAirconSettings.Mode"] == "HEAT"
+
     @pytest.mark.asyncio
     async def test_set_mode_to_cool(
         self, ac_system_with_api: ActronAirACSystem, mock_api: Any
@@ -149,6 +162,36 @@ class TestACSystemSetMode:
         assert mock_api.last_serial == "EXTERNAL123"
 
 
+class TestACSystemParentReference:
+    """Test the parent status reference is stored as a pydantic private attribute."""
+
+    def test_parent_status_is_private_attribute(self) -> None:
+        """_parent_status is registered as private, not as a field or instance dict entry."""
+        assert "_parent_status" in ActronAirACSystem.__private_attributes__
+        assert "_parent_status" not in ActronAirACSystem.model_fields
+
+        ac_system = ActronAirACSystem.model_validate({})
+        parent = ActronAirStatus(isOnline=True, lastKnownState={})
+        ac_system.set_parent_status(parent)
+
+        assert ac_system._parent_status is parent
+        assert "_parent_status" not in ac_system.__dict__
+        assert "_parent_status" not in ac_system.model_dump()
+
+
+class TestSystemInfoSerial:
+    """Test ActronAirSystemInfo serial normalisation."""
+
+    def test_serial_is_lowercased(self) -> None:
+        """Serial numbers are stored in lowercase."""
+        info = ActronAirSystemInfo.model_validate({"serial": "ABC123XyZ"})
+        assert info.serial == "abc123xyz"
+
+    def test_empty_serial_is_kept(self) -> None:
+        """An empty serial is accepted unchanged."""
+        assert ActronAirSystemInfo.model_validate({"serial": ""}).serial == ""
+
+
 class TestOutdoorUnitAliasParsing:
     """Test that OutdoorUnit fields parse from API aliases correctly."""
 
@@ -169,3 +212,11 @@ class TestOutdoorUnitAliasParsing:
         unit = ActronAirOutdoorUnit.model_validate({})
         assert unit.model_number == ""
         assert unit.software_version == ""
+
+    def test_populates_by_field_name(self) -> None:
+        """Fields can also be populated by their Python names."""
+        unit = ActronAirOutdoorUnit.model_validate(
+            {"model_number": "ESP-PLUS-7", "software_version": "v2.1"}
+        )
+        assert unit.model_number == "ESP-PLUS-7"
+        assert unit.software_version == "v2.1"